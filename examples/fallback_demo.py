@@ -7,245 +7,261 @@
 
 import os
 import sys
+import io
+import contextlib
+import textwrap
 from pathlib import Path
+from typing import NamedTuple
 
 # 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 
-def demo_fallback_scenarios():
-    """演示各种回退场景"""
-    
-    print("🔄 专用模型回退机制演示")
-    print("=" * 60)
-    print("展示当专用模型调用失败时，如何回退到DEFAULT_MODEL")
-    print("=" * 60)
-    
-    # 场景1: API密钥缺失
-    print("\n📋 场景1: API密钥缺失")
-    print("-" * 30)
-    
-    # 临时移除API密钥
-    original_api_key = os.environ.get('SILICONFLOW_API_KEY')
-    if 'SILICONFLOW_API_KEY' in os.environ:
-        del os.environ['SILICONFLOW_API_KEY']
-    
-    # 设置DEFAULT_MODEL
-    os.environ['DEFAULT_MODEL'] = 'deepseek-ai/DeepSeek-V3'
-    
-    print("🔧 配置状态:")
-    print(f"  SILICONFLOW_API_KEY: {'未设置' if not os.getenv('SILICONFLOW_API_KEY') else '已设置'}")
-    print(f"  DEFAULT_MODEL: {os.getenv('DEFAULT_MODEL')}")
-    print(f"  专用模型配置: meta-llama/Llama-3.1-70B-Instruct")
-    
-    print("\n💡 预期行为:")
-    print("  1. 尝试创建专用模型: meta-llama/Llama-3.1-70B-Instruct")
-    print("  2. 检测到API密钥缺失")
-    print("  3. 回退到DEFAULT_MODEL: deepseek-ai/DeepSeek-V3")
-    print("  4. 如果DEFAULT_MODEL也失败，回退到系统快速思考模型")
-    
-    # 场景2: 专用模型未配置
-    print("\n📋 场景2: 专用模型未配置")
-    print("-" * 30)
-    
-    print("🔧 配置状态:")
-    print(f"  专用模型配置: 未设置")
-    print(f"  DEFAULT_MODEL: {os.getenv('DEFAULT_MODEL')}")
-    
-    print("\n💡 预期行为:")
-    print("  1. 检测到专用模型未配置")
-    print("  2. 直接使用DEFAULT_MODEL: deepseek-ai/DeepSeek-V3")
-    
-    # 场景3: 模型创建失败
-    print("\n📋 场景3: 模型创建失败")
-    print("-" * 30)
-    
-    print("🔧 配置状态:")
-    print(f"  专用模型配置: invalid-model-name")
-    print(f"  DEFAULT_MODEL: {os.getenv('DEFAULT_MODEL')}")
-    
-    print("\n💡 预期行为:")
-    print("  1. 尝试创建专用模型: invalid-model-name")
-    print("  2. 模型创建失败（模型不存在）")
-    print("  3. 捕获异常，回退到DEFAULT_MODEL: deepseek-ai/DeepSeek-V3")
-    
-    # 恢复API密钥
-    if original_api_key:
-        os.environ['SILICONFLOW_API_KEY'] = original_api_key
-    
-    return True
+class FallbackModelRow(NamedTuple):
+    """推荐回退模型表中的一行"""
+    model: str
+    pros: tuple
+    cons: tuple
+    recommended: bool
 
 
-def demo_config_priority():
-    """演示配置优先级"""
-    
-    print("\n🏆 配置优先级演示")
-    print("=" * 60)
-    
-    print("📊 配置优先级顺序:")
-    print("  1. 环境变量 (最高优先级)")
-    print("  2. 默认配置文件")
-    print("  3. 硬编码默认值 (最低优先级)")
-    
-    # 演示环境变量优先级
-    print("\n🔧 环境变量优先级测试:")
-    
-    # 设置测试环境变量
-    os.environ['DEFAULT_MODEL'] = 'test-model-from-env'
-    os.environ['MARKET_ANALYST_LLM'] = 'test-market-model'
-    
+# 推荐的DEFAULT_MODEL列表（静态数据，模块加载时构建一次）
+_MODEL_TABLE: tuple[FallbackModelRow, ...] = (
+    FallbackModelRow("deepseek-ai/DeepSeek-V3",
+                     ("稳定可靠", "综合性能强", "成本适中"), ("不是最高性能",), True),
+    FallbackModelRow("Qwen/Qwen2.5-32B-Instruct",
+                     ("中文优化", "平衡性能", "情绪理解好"), ("参数规模中等",), False),
+    FallbackModelRow("meta-llama/Llama-3.1-8B-Instruct",
+                     ("轻量级", "快速响应", "成本低"), ("性能相对较低",), False),
+)
+
+# .env 配置示例模板，各场景只替换模型名称
+_ENV_TEMPLATE = textwrap.dedent("""
+    # .env 文件配置
+    SILICONFLOW_API_KEY=your_api_key_here
+    DEFAULT_MODEL={default}
+
+    # {comment}
+    MARKET_ANALYST_LLM={market}
+    FUNDAMENTALS_ANALYST_LLM={fundamentals}
+    NEWS_ANALYST_LLM={news}
+    SOCIAL_ANALYST_LLM={social}
+
+""")
+
+HIGH_PERF = {
+    "default": "deepseek-ai/DeepSeek-V3",
+    "comment": "专用高性能模型",
+    "market": "meta-llama/Llama-3.1-70B-Instruct",
+    "fundamentals": "Qwen/Qwen2.5-72B-Instruct",
+    "news": "deepseek-ai/DeepSeek-R1",
+    "social": "Qwen/Qwen2.5-32B-Instruct",
+}
+
+COST_OPT = {
+    "default": "Qwen/Qwen2.5-14B-Instruct",
+    "comment": "平衡性能和成本",
+    "market": "Qwen/Qwen2.5-32B-Instruct",
+    "fundamentals": "deepseek-ai/DeepSeek-V3",
+    "news": "deepseek-ai/DeepSeek-V3",
+    "social": "Qwen/Qwen2.5-14B-Instruct",
+}
+
+DEV_TEST = {
+    "default": "deepseek-ai/DeepSeek-V3",
+    "comment": "所有分析师使用相同模型简化测试",
+    "market": "deepseek-ai/DeepSeek-V3",
+    "fundamentals": "deepseek-ai/DeepSeek-V3",
+    "news": "deepseek-ai/DeepSeek-V3",
+    "social": "deepseek-ai/DeepSeek-V3",
+}
+
+_ENV_SCENARIOS = (
+    ("🎯 高性能配置（推荐）:", HIGH_PERF),
+    ("💰 成本优化配置:", COST_OPT),
+    ("🧪 开发测试配置:", DEV_TEST),
+)
+
+
+@contextlib.contextmanager
+def _env_overlay(**overrides):
+    """临时覆盖环境变量，退出时恢复原值；值为 None 表示临时移除该变量"""
+    saved = {key: os.environ.get(key) for key in overrides}
     try:
-        from tradingagents.default_config import DEFAULT_CONFIG
-        
-        print(f"  DEFAULT_MODEL: {DEFAULT_CONFIG.get('default_model')}")
-        print(f"  MARKET_ANALYST_LLM: {DEFAULT_CONFIG.get('market_analyst_llm')}")
-        
-        print("\n✅ 环境变量成功覆盖默认配置")
-        
-    except Exception as e:
-        print(f"❌ 配置测试失败: {e}")
-    
+        for key, value in overrides.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        yield
     finally:
-        # 清理测试环境变量
-        if 'DEFAULT_MODEL' in os.environ:
-            del os.environ['DEFAULT_MODEL']
-        if 'MARKET_ANALYST_LLM' in os.environ:
-            del os.environ['MARKET_ANALYST_LLM']
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
 
-def demo_best_practices():
-    """演示最佳实践"""
-    
-    print("\n💡 回退机制最佳实践")
-    print("=" * 60)
-    
-    print("🎯 推荐的DEFAULT_MODEL选择:")
-    
-    models = [
-        {
-            "model": "deepseek-ai/DeepSeek-V3",
-            "pros": ["稳定可靠", "综合性能强", "成本适中"],
-            "cons": ["不是最高性能"],
-            "recommended": True
-        },
-        {
-            "model": "Qwen/Qwen2.5-32B-Instruct", 
-            "pros": ["中文优化", "平衡性能", "情绪理解好"],
-            "cons": ["参数规模中等"],
-            "recommended": False
-        },
-        {
-            "model": "meta-llama/Llama-3.1-8B-Instruct",
-            "pros": ["轻量级", "快速响应", "成本低"],
-            "cons": ["性能相对较低"],
-            "recommended": False
-        }
-    ]
-    
-    for model in models:
-        status = "🥇 推荐" if model["recommended"] else "⚡ 备选"
-        print(f"\n{status} {model['model']}")
-        print(f"  优点: {', '.join(model['pros'])}")
-        print(f"  缺点: {', '.join(model['cons'])}")
-    
-    print("\n🔧 配置建议:")
-    print("  1. 生产环境: 使用稳定的DEFAULT_MODEL")
-    print("  2. 开发环境: 可以使用轻量级模型降低成本")
-    print("  3. 测试环境: 使用与生产环境相同的配置")
-    print("  4. 监控日志: 关注回退频率，优化专用模型配置")
-    
-    print("\n📊 监控指标:")
-    print("  - 专用模型成功率")
-    print("  - 回退模型使用频率") 
-    print("  - API调用成本")
-    print("  - 分析质量对比")
+def _banner(title: str, width: int = 60) -> str:
+    """章节标题"""
+    return f"\n{title}\n{'=' * width}\n"
 
 
-def demo_configuration_examples():
-    """演示配置示例"""
-    
-    print("\n📝 配置示例")
-    print("=" * 60)
-    
-    print("🎯 高性能配置（推荐）:")
-    print("""
-# .env 文件配置
-SILICONFLOW_API_KEY=your_api_key_here
-DEFAULT_MODEL=deepseek-ai/DeepSeek-V3
-
-# 专用高性能模型
-MARKET_ANALYST_LLM=meta-llama/Llama-3.1-70B-Instruct
-FUNDAMENTALS_ANALYST_LLM=Qwen/Qwen2.5-72B-Instruct
-NEWS_ANALYST_LLM=deepseek-ai/DeepSeek-R1
-SOCIAL_ANALYST_LLM=Qwen/Qwen2.5-32B-Instruct
+def _render_fallback_scenarios(out):
+    """各种回退场景"""
+    
+    # 场景配置只构建一次，仅用于格式化说明文字，不改动环境变量
+    env = {
+        'SILICONFLOW_API_KEY': None,
+        'DEFAULT_MODEL': 'deepseek-ai/DeepSeek-V3',
+    }
+    default_model = env['DEFAULT_MODEL']
+    api_key_status = '未设置' if not env['SILICONFLOW_API_KEY'] else '已设置'
+    
+    out.write(f"""展示当专用模型调用失败时，如何回退到DEFAULT_MODEL
+
+📋 场景1: API密钥缺失
+{'-' * 30}
+🔧 配置状态:
+  SILICONFLOW_API_KEY: {api_key_status}
+  DEFAULT_MODEL: {default_model}
+  专用模型配置: meta-llama/Llama-3.1-70B-Instruct
+
+💡 预期行为:
+  1. 尝试创建专用模型: meta-llama/Llama-3.1-70B-Instruct
+  2. 检测到API密钥缺失
+  3. 回退到DEFAULT_MODEL: {default_model}
+  4. 如果DEFAULT_MODEL也失败，回退到系统快速思考模型
+
+📋 场景2: 专用模型未配置
+{'-' * 30}
+🔧 配置状态:
+  专用模型配置: 未设置
+  DEFAULT_MODEL: {default_model}
+
+💡 预期行为:
+  1. 检测到专用模型未配置
+  2. 直接使用DEFAULT_MODEL: {default_model}
+
+📋 场景3: 模型创建失败
+{'-' * 30}
+🔧 配置状态:
+  专用模型配置: invalid-model-name
+  DEFAULT_MODEL: {default_model}
+
+💡 预期行为:
+  1. 尝试调用专用模型: invalid-model-name
+  2. 服务端返回404（模型不存在），属于不可恢复错误，不做退避重试
+  3. 立即回退到DEFAULT_MODEL: {default_model}
 """)
+
+
+def _render_config_priority(out):
+    """配置优先级"""
     
-    print("💰 成本优化配置:")
-    print("""
-# .env 文件配置
-SILICONFLOW_API_KEY=your_api_key_here
-DEFAULT_MODEL=Qwen/Qwen2.5-14B-Instruct
-
-# 平衡性能和成本
-MARKET_ANALYST_LLM=Qwen/Qwen2.5-32B-Instruct
-FUNDAMENTALS_ANALYST_LLM=deepseek-ai/DeepSeek-V3
-NEWS_ANALYST_LLM=deepseek-ai/DeepSeek-V3
-SOCIAL_ANALYST_LLM=Qwen/Qwen2.5-14B-Instruct
+    out.write("""📊 配置优先级顺序:
+  1. 环境变量 (最高优先级)
+  2. 默认配置文件
+  3. 硬编码默认值 (最低优先级)
+
+🔧 环境变量优先级测试:
 """)
     
-    print("🧪 开发测试配置:")
-    print("""
-# .env 文件配置
-SILICONFLOW_API_KEY=your_api_key_here
-DEFAULT_MODEL=deepseek-ai/DeepSeek-V3
-
-# 所有分析师使用相同模型简化测试
-MARKET_ANALYST_LLM=deepseek-ai/DeepSeek-V3
-FUNDAMENTALS_ANALYST_LLM=deepseek-ai/DeepSeek-V3
-NEWS_ANALYST_LLM=deepseek-ai/DeepSeek-V3
-SOCIAL_ANALYST_LLM=deepseek-ai/DeepSeek-V3
+    # 临时设置测试环境变量，退出时自动清理
+    with _env_overlay(DEFAULT_MODEL='test-model-from-env',
+                      MARKET_ANALYST_LLM='test-market-model'):
+        try:
+            from tradingagents.default_config import build_default_config
+            
+            # 在覆盖的环境变量下重新构建配置；导入时生成的DEFAULT_CONFIG不会反映这些变量
+            config = build_default_config()
+            out.write(f"  DEFAULT_MODEL: {config.get('default_model')}\n")
+            out.write(f"  MARKET_ANALYST_LLM: {config.get('market_analyst_llm')}\n")
+            out.write("\n✅ 环境变量成功覆盖默认配置\n")
+            
+        except Exception as e:
+            out.write(f"❌ 配置测试失败: {e}\n")
+
+
+def _render_best_practices(out):
+    """最佳实践"""
+    
+    out.write("🎯 推荐的DEFAULT_MODEL选择:\n")
+    for row in _MODEL_TABLE:
+        status = "🥇 推荐" if row.recommended else "⚡ 备选"
+        out.write(f"\n{status} {row.model}\n"
+                  f"  优点: {', '.join(row.pros)}\n"
+                  f"  缺点: {', '.join(row.cons)}\n")
+    
+    out.write("""
+🔧 配置建议:
+  1. 生产环境: 使用稳定的DEFAULT_MODEL
+  2. 开发环境: 可以使用轻量级模型降低成本
+  3. 测试环境: 使用与生产环境相同的配置
+  4. 监控日志: 关注回退频率，优化专用模型配置
+
+📊 监控指标:
+  - 专用模型成功率
+  - 回退模型使用频率
+  - API调用成本
+  - 分析质量对比
 """)
 
 
+def _render_configuration_examples(out):
+    """配置示例"""
+    
+    for label, params in _ENV_SCENARIOS:
+        out.write(label + "\n")
+        out.write(_ENV_TEMPLATE.format_map(params))
+
+
+# 演示章节：(标题, 渲染函数)，按顺序输出
+_SECTIONS = (
+    ("🔄 专用模型回退机制演示", _render_fallback_scenarios),
+    ("🏆 配置优先级演示", _render_config_priority),
+    ("💡 回退机制最佳实践", _render_best_practices),
+    ("📝 配置示例", _render_configuration_examples),
+)
+
+
 def main():
     """主演示函数"""
     
-    print("🚀 TradingAgents-CN 回退机制演示")
-    print("=" * 80)
-    print("🎯 目标: 展示专用模型调用失败时的智能回退机制")
-    print("=" * 80)
+    buf = io.StringIO()
+    buf.write("🚀 TradingAgents-CN 回退机制演示\n")
+    buf.write("=" * 80 + "\n")
+    buf.write("🎯 目标: 展示专用模型调用失败时的智能回退机制\n")
+    buf.write("=" * 80 + "\n")
     
     try:
-        # 演示回退场景
-        demo_fallback_scenarios()
-        
-        # 演示配置优先级
-        demo_config_priority()
-        
-        # 演示最佳实践
-        demo_best_practices()
-        
-        # 演示配置示例
-        demo_configuration_examples()
-        
-        print("\n🎉 回退机制演示完成！")
-        print("\n💡 关键要点:")
-        print("  1. 系统具有多层回退机制，确保稳定运行")
-        print("  2. DEFAULT_MODEL作为可靠的回退选择")
-        print("  3. 环境变量配置具有最高优先级")
-        print("  4. 推荐使用deepseek-ai/DeepSeek-V3作为DEFAULT_MODEL")
-        print("  5. 监控回退频率以优化配置")
-        
-        print("\n🔧 下一步:")
-        print("  1. 设置.env文件中的DEFAULT_MODEL")
-        print("  2. 配置专用分析师模型")
-        print("  3. 测试回退机制是否正常工作")
-        print("  4. 监控生产环境中的模型使用情况")
+        for title, render in _SECTIONS:
+            buf.write(_banner(title))
+            render(buf)
         
+        buf.write("""
+🎉 回退机制演示完成！
+
+💡 关键要点:
+  1. 系统具有多层回退机制，确保稳定运行
+  2. DEFAULT_MODEL作为可靠的回退选择
+  3. 环境变量配置具有最高优先级
+  4. 推荐使用deepseek-ai/DeepSeek-V3作为DEFAULT_MODEL
+  5. 监控回退频率以优化配置
+
+🔧 下一步:
+  1. 设置.env文件中的DEFAULT_MODEL
+  2. 配置专用分析师模型
+  3. 测试回退机制是否正常工作
+  4. 监控生产环境中的模型使用情况
+""")
+        sys.stdout.write(buf.getvalue())
         return True
         
     except Exception as e:
+        sys.stdout.write(buf.getvalue())
         print(f"\n❌ 演示过程出错: {e}")
         return False
 
@@ -6,21 +6,66 @@
 """
 
 import os
-from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.graph.trading_graph import TradingAgentsGraph
+import sys
+import functools
+from types import MappingProxyType
+from typing import NamedTuple
 
 
+class ModelRow(NamedTuple):
+    """模型对比表中的一行"""
+    name: str
+    params: str
+    context: str
+    performance: str
+    price: str
+    best_for: str
+
+
+# 模型性能对比表（静态数据，模块加载时构建一次）
+_MODEL_TABLE: tuple[ModelRow, ...] = (
+    ModelRow("Qwen/Qwen2.5-72B-Instruct", "72B", "32K", "🥇 最高", "💰💰💰💰💰",
+             "复杂推理、基本面分析、最终决策"),
+    ModelRow("meta-llama/Llama-3.1-70B-Instruct", "70B", "128K", "🥈 超强", "💰💰💰💰",
+             "长文本处理、技术分析、数据处理"),
+    ModelRow("deepseek-ai/DeepSeek-R1", "未知", "64K", "🥉 推理专用", "💰💰💰",
+             "逻辑推理、新闻分析、快速思考"),
+    ModelRow("Qwen/Qwen2.5-32B-Instruct", "32B", "32K", "🎯 中文优化", "💰💰",
+             "中文理解、情绪分析、社交媒体"),
+)
+
+
+def _render(rows) -> str:
+    """将模型对比表渲染为完整的输出文本"""
+    lines = ["\n📊 硅基流动模型性能对比", "=" * 80]
+    lines.extend(
+        f"\n🤖 {row.name}\n"
+        f"   参数规模: {row.params}\n"
+        f"   上下文长度: {row.context}\n"
+        f"   性能等级: {row.performance}\n"
+        f"   价格等级: {row.price}\n"
+        f"   最适合: {row.best_for}"
+        for row in rows
+    )
+    return "\n".join(lines) + "\n"
+
+
+# 对比表内容完全静态，导入时渲染一次
+_RENDERED_TABLE = _render(_MODEL_TABLE)
+
+
+@functools.lru_cache(maxsize=1)
 def create_high_performance_config():
-    """创建高性能模型配置"""
-    
-    # 基于默认配置创建高性能配置
-    config = DEFAULT_CONFIG.copy()
+    """创建高性能模型配置（只构建一次，返回只读视图）"""
     
-    # 确保使用硅基流动作为提供商
-    config["llm_provider"] = "siliconflow"
+    from tradingagents.default_config import DEFAULT_CONFIG
     
-    # 🥇 最高性能配置 - 优先选择价格最贵、性能最好的模型
-    config.update({
+    # 基于默认配置一次性合并高性能覆盖项
+    config = DEFAULT_CONFIG | {
+        # 确保使用硅基流动作为提供商
+        "llm_provider": "siliconflow",
+        
+        # 🥇 最高性能配置 - 优先选择价格最贵、性能最好的模型
         # 深度思考层 - 最终决策使用最强模型
         "deep_think_llm": "Qwen/Qwen2.5-72B-Instruct",      # 72B参数，最高性能
         "quick_think_llm": "deepseek-ai/DeepSeek-R1",       # 推理专用，快速响应
@@ -35,9 +80,10 @@ def create_high_performance_config():
         "max_debate_rounds": 2,          # 增加辩论轮次，充分利用高性能模型
         "max_risk_discuss_rounds": 2,    # 增加风险讨论轮次
         "online_tools": True,            # 启用在线工具
-    })
+        "stream_deep_think": True,       # 深度思考模型流式输出，尽早看到决策内容
+    }
     
-    return config
+    return MappingProxyType(config)
 
 
 def demo_high_performance_analysis():
@@ -75,10 +121,12 @@ def demo_high_performance_analysis():
     try:
         # 创建交易分析图
         print("\n🔧 初始化高性能交易分析图...")
+        from tradingagents.graph.trading_graph import TradingAgentsGraph
+        
         ta = TradingAgentsGraph(
             selected_analysts=["market", "fundamentals", "news", "social"],
             debug=True,
-            config=config
+            config=dict(config)  # 缓存配置只读，传入可变副本
         )
         
         print("✅ 高性能交易分析图初始化成功")
@@ -115,52 +163,7 @@ def demo_high_performance_analysis():
 
 def show_model_comparison():
     """显示模型性能对比"""
-    
-    print("\n📊 硅基流动模型性能对比")
-    print("=" * 80)
-    
-    models = [
-        {
-            "name": "Qwen/Qwen2.5-72B-Instruct",
-            "params": "72B",
-            "context": "32K",
-            "performance": "🥇 最高",
-            "price": "💰💰💰💰💰",
-            "best_for": "复杂推理、基本面分析、最终决策"
-        },
-        {
-            "name": "meta-llama/Llama-3.1-70B-Instruct", 
-            "params": "70B",
-            "context": "128K",
-            "performance": "🥈 超强",
-            "price": "💰💰💰💰",
-            "best_for": "长文本处理、技术分析、数据处理"
-        },
-        {
-            "name": "deepseek-ai/DeepSeek-R1",
-            "params": "未知",
-            "context": "64K", 
-            "performance": "🥉 推理专用",
-            "price": "💰💰💰",
-            "best_for": "逻辑推理、新闻分析、快速思考"
-        },
-        {
-            "name": "Qwen/Qwen2.5-32B-Instruct",
-            "params": "32B",
-            "context": "32K",
-            "performance": "🎯 中文优化",
-            "price": "💰💰",
-            "best_for": "中文理解、情绪分析、社交媒体"
-        }
-    ]
-    
-    for model in models:
-        print(f"\n🤖 {model['name']}")
-        print(f"   参数规模: {model['params']}")
-        print(f"   上下文长度: {model['context']}")
-        print(f"   性能等级: {model['performance']}")
-        print(f"   价格等级: {model['price']}")
-        print(f"   最适合: {model['best_for']}")
+    sys.stdout.write(_RENDERED_TABLE)
 
 
 def main():
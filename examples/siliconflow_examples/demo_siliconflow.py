@@ -7,23 +7,100 @@
 
 import os
 import sys
+import time
+import hashlib
+import functools
 from pathlib import Path
+from typing import NamedTuple, Sequence
 
 # 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 
 
+class ModelConfigRow(NamedTuple):
+    """可选模型配置表中的一行"""
+    name: str
+    deep_model: str
+    quick_model: str
+    description: str
+
+
+# 可选模型配置（静态数据，模块加载时构建一次）
+_MODEL_TABLE: tuple[ModelConfigRow, ...] = (
+    ModelConfigRow("DeepSeek Chat", "deepseek-chat", "deepseek-chat",
+                   "DeepSeek 通用对话模型 - 成本效益高"),
+    ModelConfigRow("通义千问 Plus", "qwen-plus", "qwen-turbo",
+                   "阿里通义千问 - 中文优化"),
+    ModelConfigRow("Claude 3 Sonnet", "claude-3-sonnet", "claude-3-haiku",
+                   "Anthropic Claude - 安全性高"),
+    ModelConfigRow("GPT-4o", "gpt-4o", "gpt-4o-mini",
+                   "OpenAI GPT-4o - 多模态能力"),
+)
+
+# 可选股票列表
+_STOCK_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("AAPL", "苹果公司 - 美股科技股"),
+    ("TSLA", "特斯拉 - 美股电动车"),
+    ("NVDA", "英伟达 - 美股AI芯片"),
+    ("000001", "平安银行 - A股银行"),
+    ("600036", "招商银行 - A股银行"),
+    ("000858", "五粮液 - A股白酒"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _env(key: str, default: str = "") -> str:
+    """读取环境变量并在进程内缓存；运行中修改环境变量后需调用 _env.cache_clear()"""
+    return os.environ.get(key, default)
+
+
+# 最近一次连接测试成功的标记文件，内容为API密钥指纹
+_CONN_OK_FILE = Path.home() / ".cache" / "tradingagents" / "siliconflow_ok"
+
+
+def _key_fingerprint() -> str:
+    """API密钥指纹（不落盘明文密钥）"""
+    return hashlib.sha1(_env('SILICONFLOW_API_KEY').encode()).hexdigest()[:16]
+
+
+def _conn_ok_recently(ttl: int = 300) -> bool:
+    """同一密钥在 ttl 秒内已连接成功过则跳过连接测试"""
+    try:
+        if time.time() - _CONN_OK_FILE.stat().st_mtime >= ttl:
+            return False
+        return _CONN_OK_FILE.read_text(encoding='utf-8') == _key_fingerprint()
+    except OSError:
+        return False
+
+
+def _mark_conn_ok():
+    """记录连接测试成功"""
+    try:
+        _CONN_OK_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _CONN_OK_FILE.write_text(_key_fingerprint(), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def _pick(prompt: str, options: Sequence, default: int = 1) -> int:
+    """读取用户选择，返回选项下标（从0开始）；输入为空时使用默认值"""
+    valid = {str(i): i - 1 for i in range(1, len(options) + 1)}
+    while (answer := input(prompt).strip() or str(default)) not in valid:
+        print(f"❌ 请输入 1-{len(options)} 之间的数字")
+    return valid[answer]
+
+
 def check_api_keys():
     """检查必需的API密钥"""
     print("🔑 检查API密钥配置")
     print("=" * 50)
     
     # 检查硅基流动API密钥
-    siliconflow_key = os.getenv('SILICONFLOW_API_KEY')
+    siliconflow_key = _env('SILICONFLOW_API_KEY')
     if not siliconflow_key:
         print("❌ 错误: 未找到 SILICONFLOW_API_KEY 环境变量")
         print("💡 获取方式:")
@@ -33,7 +110,7 @@ def check_api_keys():
         return False
     
     # 检查FinnHub API密钥（用于获取美股数据）
-    finnhub_key = os.getenv('FINNHUB_API_KEY')
+    finnhub_key = _env('FINNHUB_API_KEY')
     if not finnhub_key:
         print("⚠️ 警告: 未找到 FINNHUB_API_KEY，美股数据功能可能受限")
         print("💡 获取方式:")
@@ -53,56 +130,17 @@ def demo_siliconflow_models():
     print("🤖 硅基流动模型演示")
     print("=" * 50)
     
-    # 测试不同模型的配置
-    model_configs = [
-        {
-            "name": "DeepSeek Chat",
-            "deep_model": "deepseek-chat",
-            "quick_model": "deepseek-chat",
-            "description": "DeepSeek 通用对话模型 - 成本效益高"
-        },
-        {
-            "name": "通义千问 Plus",
-            "deep_model": "qwen-plus",
-            "quick_model": "qwen-turbo",
-            "description": "阿里通义千问 - 中文优化"
-        },
-        {
-            "name": "Claude 3 Sonnet",
-            "deep_model": "claude-3-sonnet",
-            "quick_model": "claude-3-haiku",
-            "description": "Anthropic Claude - 安全性高"
-        },
-        {
-            "name": "GPT-4o",
-            "deep_model": "gpt-4o",
-            "quick_model": "gpt-4o-mini",
-            "description": "OpenAI GPT-4o - 多模态能力"
-        }
-    ]
-    
+    model_configs = _MODEL_TABLE
     for i, model_config in enumerate(model_configs, 1):
-        print(f"{i}. {model_config['name']}")
-        print(f"   深度思考: {model_config['deep_model']}")
-        print(f"   快速任务: {model_config['quick_model']}")
-        print(f"   特点: {model_config['description']}")
+        print(f"{i}. {model_config.name}")
+        print(f"   深度思考: {model_config.deep_model}")
+        print(f"   快速任务: {model_config.quick_model}")
+        print(f"   特点: {model_config.description}")
         print()
     
     # 让用户选择模型
-    while True:
-        try:
-            choice = input(f"请选择模型配置 (1-{len(model_configs)}) [默认: 1]: ").strip()
-            if not choice:
-                choice = "1"
-            
-            choice_idx = int(choice) - 1
-            if 0 <= choice_idx < len(model_configs):
-                selected_config = model_configs[choice_idx]
-                break
-            else:
-                print(f"❌ 请输入 1-{len(model_configs)} 之间的数字")
-        except ValueError:
-            print("❌ 请输入有效的数字")
+    choice_idx = _pick(f"请选择模型配置 (1-{len(model_configs)}) [默认: 1]: ", model_configs)
+    selected_config = model_configs[choice_idx]
     
     return selected_config
 
@@ -116,21 +154,25 @@ def run_siliconflow_analysis():
     if not check_api_keys():
         return
     
+    # 通过密钥检查后再导入，仅查看菜单或密钥缺失时无需加载整个交易图
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+    
     # 选择模型配置
     model_config = demo_siliconflow_models()
     
-    print(f"📊 选择的配置: {model_config['name']}")
-    print(f"   深度思考模型: {model_config['deep_model']}")
-    print(f"   快速思考模型: {model_config['quick_model']}")
+    print(f"📊 选择的配置: {model_config.name}")
+    print(f"   深度思考模型: {model_config.deep_model}")
+    print(f"   快速思考模型: {model_config.quick_model}")
     print()
     
     # 创建硅基流动配置
     config = DEFAULT_CONFIG.copy()
     config["llm_provider"] = "siliconflow"
-    config["deep_think_llm"] = model_config["deep_model"]
-    config["quick_think_llm"] = model_config["quick_model"]
+    config["deep_think_llm"] = model_config.deep_model
+    config["quick_think_llm"] = model_config.quick_model
     config["max_debate_rounds"] = 1  # 减少辩论轮次以降低成本
     config["online_tools"] = True
+    config["stream_deep_think"] = True  # 深度思考模型流式输出，无需等待全部分析完成
     
     print("📊 配置信息:")
     print(f"  LLM 提供商: {config['llm_provider']}")
@@ -141,33 +183,14 @@ def run_siliconflow_analysis():
     print()
     
     # 选择股票
-    stock_options = [
-        ("AAPL", "苹果公司 - 美股科技股"),
-        ("TSLA", "特斯拉 - 美股电动车"),
-        ("NVDA", "英伟达 - 美股AI芯片"),
-        ("000001", "平安银行 - A股银行"),
-        ("600036", "招商银行 - A股银行"),
-        ("000858", "五粮液 - A股白酒")
-    ]
+    stock_options = _STOCK_OPTIONS
     
     print("📈 可选股票:")
     for i, (symbol, name) in enumerate(stock_options, 1):
         print(f"  {i}. {symbol} - {name}")
     
-    while True:
-        try:
-            choice = input(f"请选择股票 (1-{len(stock_options)}) [默认: 1]: ").strip()
-            if not choice:
-                choice = "1"
-            
-            choice_idx = int(choice) - 1
-            if 0 <= choice_idx < len(stock_options):
-                selected_stock, stock_name = stock_options[choice_idx]
-                break
-            else:
-                print(f"❌ 请输入 1-{len(stock_options)} 之间的数字")
-        except ValueError:
-            print("❌ 请输入有效的数字")
+    choice_idx = _pick(f"请选择股票 (1-{len(stock_options)}) [默认: 1]: ", stock_options)
+    selected_stock, stock_name = stock_options[choice_idx]
     
     print(f"\n🎯 选择的股票: {selected_stock} - {stock_name}")
     print()
@@ -207,11 +230,16 @@ def test_siliconflow_connection():
     print("🧪 硅基流动连接测试")
     print("=" * 50)
     
+    if _conn_ok_recently():
+        print("✅ 最近已成功连接，跳过连接测试")
+        return True
+    
     try:
         from tradingagents.llm_adapters.siliconflow_adapter import test_siliconflow_connection
         
         if test_siliconflow_connection():
             print("✅ 硅基流动连接测试成功")
+            _mark_conn_ok()
             return True
         else:
             print("❌ 硅基流动连接测试失败")
@@ -7,15 +7,90 @@
 
 import os
 import sys
+import functools
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
+from tradingagents.core.decorators import RetryConfig, retry_with_backoff
+from tradingagents.llm_adapters.siliconflow_adapter import (
+    TRANSIENT_ERRORS,
+    create_siliconflow_llm,
+    get_siliconflow_breaker,
+)
+from langchain_core.messages import HumanMessage
 
-def test_basic_chat():
-    """测试基本对话功能"""
+# 只对瞬时错误（限流、超时、连接错误、服务端5xx）重试；401/403/404 等永久错误立即抛出
+_RETRY_CONFIG = RetryConfig(
+    max_attempts=4,
+    base_delay=1.0,
+    max_delay=8.0,
+    retryable_exceptions=TRANSIENT_ERRORS
+)
+
+# 固定不变的提示消息只构建一次
+_BASIC_MSG = HumanMessage(content="你好，请简单介绍一下你自己。")
+_COMPARISON_MSG = HumanMessage(content="请用一句话总结比特币的投资风险。")
+_FIN_MSG = HumanMessage(content=textwrap.dedent("""
+    请分析苹果公司(AAPL)的投资价值，从以下角度：
+    1. 公司基本面
+    2. 技术面分析
+    3. 市场前景
+    4. 风险因素
+    5. 投资建议
+    
+    请简洁回答，每个方面2-3句话即可。
+""").strip())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_llm(model: str, temperature: float, max_tokens: int):
+    """按 (模型, 温度, 最大token) 缓存模型实例，复用底层HTTP连接"""
+    return create_siliconflow_llm(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+
+
+@retry_with_backoff(_RETRY_CONFIG)
+def _invoke(llm, messages):
+    """带指数退避重试的模型调用；经共享断路器调用，服务持续故障时快速失败"""
+    return get_siliconflow_breaker().call(llm.invoke, messages)
+
+
+# 纯文本提示：测试名 -> (模型, 最大token数, 消息)
+_PLAIN_PROMPTS = {
+    "基本对话": ("deepseek-chat", 500, _BASIC_MSG),
+    "金融分析": ("qwen-plus", 1000, _FIN_MSG),
+}
+
+
+def _prefetch(prompts):
+    """并发发送各纯文本提示（经 _invoke 重试与断路器）；返回 测试名 -> 回复或异常"""
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(len(prompts), 1)) as executor:
+        futures = {}
+        for name, (model, max_tokens, message) in prompts.items():
+            try:
+                futures[executor.submit(_invoke, _get_llm(model, 0.1, max_tokens), [message])] = name
+            except Exception as e:
+                results[name] = e
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+    return results
+
+
+def test_basic_chat(response=None):
+    """测试基本对话功能（response 为预先并发获取的回复）"""
     print("🤖 硅基流动基本对话测试")
     print("=" * 50)
     
@@ -29,20 +104,13 @@ def test_basic_chat():
     print(f"✅ API密钥: {api_key[:10]}...")
     
     try:
-        from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
-        from langchain_core.messages import HumanMessage
-        
-        # 创建模型实例
-        print("\n🔧 创建DeepSeek模型实例...")
-        llm = create_siliconflow_llm(
-            model="deepseek-chat",
-            temperature=0.1,
-            max_tokens=500
-        )
-        
         # 测试简单对话
         print("💬 测试简单对话...")
-        response = llm.invoke([HumanMessage(content="你好，请简单介绍一下你自己。")])
+        if response is None:
+            print("\n🔧 创建DeepSeek模型实例...")
+            response = _invoke(_get_llm("deepseek-chat", 0.1, 500), [_BASIC_MSG])
+        elif isinstance(response, Exception):
+            raise response
         print(f"🤖 回复: {response.content}")
         
         return True
@@ -52,37 +120,19 @@ def test_basic_chat():
         return False
 
 
-def test_financial_analysis():
-    """测试金融分析功能"""
+def test_financial_analysis(response=None):
+    """测试金融分析功能（response 为预先并发获取的回复）"""
     print("\n📈 硅基流动金融分析测试")
     print("=" * 50)
     
     try:
-        from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
-        from langchain_core.messages import HumanMessage
-        
-        # 创建模型实例
-        print("🔧 创建Qwen模型实例...")
-        llm = create_siliconflow_llm(
-            model="qwen-plus",
-            temperature=0.1,
-            max_tokens=1000
-        )
-        
         # 测试金融分析
         print("📊 测试金融分析...")
-        financial_prompt = """
-        请分析苹果公司(AAPL)的投资价值，从以下角度：
-        1. 公司基本面
-        2. 技术面分析
-        3. 市场前景
-        4. 风险因素
-        5. 投资建议
-        
-        请简洁回答，每个方面2-3句话即可。
-        """
-        
-        response = llm.invoke([HumanMessage(content=financial_prompt)])
+        if response is None:
+            print("🔧 创建Qwen模型实例...")
+            response = _invoke(_get_llm("qwen-plus", 0.1, 1000), [_FIN_MSG])
+        elif isinstance(response, Exception):
+            raise response
         print(f"📈 分析结果:\n{response.content}")
         
         return True
@@ -103,26 +153,24 @@ def test_model_comparison():
         ("gpt-4o-mini", "GPT-4o Mini")
     ]
     
-    question = "请用一句话总结比特币的投资风险。"
-    
-    for model_id, model_name in models_to_test:
-        try:
+    # 各模型请求相互独立，并发发出，总耗时约为最慢的一次调用
+    futures = {}
+    with ThreadPoolExecutor(max_workers=len(models_to_test)) as executor:
+        for model_id, model_name in models_to_test:
             print(f"\n🧠 测试 {model_name}...")
-            
-            from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
-            from langchain_core.messages import HumanMessage
-            
-            llm = create_siliconflow_llm(
-                model=model_id,
-                temperature=0.1,
-                max_tokens=200
-            )
-            
-            response = llm.invoke([HumanMessage(content=question)])
-            print(f"✅ {model_name}: {response.content}")
-            
-        except Exception as e:
-            print(f"❌ {model_name} 测试失败: {e}")
+            try:
+                llm = _get_llm(model_id, 0.1, 200)
+                futures[executor.submit(_invoke, llm, [_COMPARISON_MSG])] = model_name
+            except Exception as e:
+                print(f"❌ {model_name} 测试失败: {e}")
+        
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                response = future.result()
+                print(f"✅ {model_name}: {response.content}")
+            except Exception as e:
+                print(f"❌ {model_name} 测试失败: {e}")
 
 
 def test_tool_calling():
@@ -131,8 +179,6 @@ def test_tool_calling():
     print("=" * 50)
     
     try:
-        from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
-        from langchain_core.messages import HumanMessage
         from langchain_core.tools import tool
         
         # 定义一个简单的工具
@@ -148,18 +194,14 @@ def test_tool_calling():
         
         # 创建支持工具调用的模型
         print("🔧 创建支持工具调用的模型...")
-        llm = create_siliconflow_llm(
-            model="deepseek-chat",
-            temperature=0.1,
-            max_tokens=500
-        )
+        llm = _get_llm("deepseek-chat", 0.1, 500)
         
         # 绑定工具
         llm_with_tools = llm.bind_tools([get_stock_price])
         
         # 测试工具调用
         print("🛠️ 测试工具调用...")
-        response = llm_with_tools.invoke([
+        response = _invoke(llm_with_tools, [
             HumanMessage(content="请帮我查询AAPL和TSLA的股票价格")
         ])
         
@@ -195,12 +237,18 @@ def main():
         ("工具调用", test_tool_calling),
     ]
     
+    # 纯文本提示预先并发发出，对应测试直接使用结果
+    prefetched = _prefetch(_PLAIN_PROMPTS) if os.getenv('SILICONFLOW_API_KEY') else {}
+    
     results = {}
     
     for test_name, test_func in tests:
         try:
             print(f"\n{'='*20} {test_name} {'='*20}")
-            results[test_name] = test_func()
+            if test_name in prefetched:
+                results[test_name] = test_func(prefetched[test_name])
+            else:
+                results[test_name] = test_func()
         except Exception as e:
             print(f"❌ {test_name} 出现异常: {e}")
             results[test_name] = False
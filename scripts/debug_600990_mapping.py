@@ -5,14 +5,34 @@
 找出为什么600990会被错误地显示为"四维图新"而不是"四创电子"
 """
 
+import argparse
+import mmap
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 股票代码及正确/错误名称的UTF-8字节形式，用于字节级搜索
+_CODE = b"600990"
+_NAME_RIGHT = "四创电子".encode('utf-8')
+_NAME_WRONG = "四维图新".encode('utf-8')
+_LINE_HIT_RE = re.compile(re.escape(_CODE) + b"|" + re.escape(_NAME_WRONG))
+
+
+def _memoize_mongodb_lookup():
+    """为tdx_utils的MongoDB股票名称查询加上进程内缓存，同一代码只查一次库"""
+    from tradingagents.dataflows import tdx_utils
+    
+    lookup = tdx_utils._get_stock_name_from_mongodb
+    if not hasattr(lookup, "cache_info"):
+        tdx_utils._get_stock_name_from_mongodb = lru_cache(maxsize=4096)(lookup)
+    return tdx_utils._get_stock_name_from_mongodb
+
 
 def test_china_news_enhanced_mapping():
     """测试china_news_enhanced模块的映射"""
@@ -45,6 +65,7 @@ def test_tdx_utils_mapping():
     try:
         from tradingagents.dataflows.tdx_utils import TongDaXinDataProvider
         
+        _memoize_mongodb_lookup()
         provider = TongDaXinDataProvider()
         name = provider._get_stock_name('600990')
         
@@ -105,12 +126,14 @@ def test_agent_utils_integration():
         result = toolkit.get_china_stock_news_enhanced("600990", "2024-12-20")
         content = result.content if hasattr(result, 'content') else result
         
+        content_bytes = content.encode('utf-8')
+        
         print(f"  agent_utils新闻工具结果长度: {len(content)}")
         
-        if "四创电子" in content:
+        if _NAME_RIGHT in content_bytes:
             print("  ✅ agent_utils使用正确的股票名称")
             return True
-        elif "四维图新" in content:
+        elif _NAME_WRONG in content_bytes:
             print("  ❌ agent_utils使用错误的股票名称'四维图新'")
             print(f"  📋 内容预览: {content[:200]}...")
             return False
@@ -142,12 +165,13 @@ def test_web_interface():
             full_path = project_root / file_path
             if full_path.exists():
                 try:
-                    content = full_path.read_text(encoding='utf-8')
-                    if "600990" in content:
+                    raw = full_path.read_bytes()
+                    # 字节级预过滤：不含目标代码的文件无需解码和分行
+                    if _CODE in raw:
                         print(f"  📁 在{file_path}中找到600990")
                         
                         # 查找相关行
-                        lines = content.split('\n')
+                        lines = raw.decode('utf-8', errors='replace').split('\n')
                         for i, line in enumerate(lines):
                             if "600990" in line:
                                 print(f"    第{i+1}行: {line.strip()}")
@@ -175,7 +199,7 @@ def test_database_cache():
     
     try:
         # 检查是否有MongoDB缓存
-        from tradingagents.dataflows.tdx_utils import _get_stock_name_from_mongodb
+        _get_stock_name_from_mongodb = _memoize_mongodb_lookup()
         
         mongodb_name = _get_stock_name_from_mongodb('600990')
         
@@ -218,16 +242,35 @@ def search_all_files_for_mapping():
             if dir_path.exists():
                 for py_file in dir_path.rglob("*.py"):
                     try:
-                        content = py_file.read_text(encoding='utf-8')
-                        if "600990" in content and "四维图新" in content:
+                        # mmap按需分页读取，未命中的文件不会生成任何字符串对象
+                        with open(py_file, 'rb') as f, \
+                                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            # 一次正则扫描，按命中的字面量分桶记录位置
+                            code_hits, name_hits = [], []
+                            for match in _LINE_HIT_RE.finditer(mm):
+                                bucket = code_hits if match.group() == _CODE else name_hits
+                                bucket.append(match.start())
+                            if not code_hits or not name_hits:
+                                continue
+                            
                             found_files.append(py_file)
                             print(f"  ❌ 发现错误映射: {py_file.relative_to(project_root)}")
                             
-                            # 显示相关行
-                            lines = content.split('\n')
-                            for i, line in enumerate(lines):
-                                if "600990" in line and "四维图新" in line:
-                                    print(f"    第{i+1}行: {line.strip()}")
+                            # 显示相关行：只解码包含600990的行
+                            line_no, scanned, last_start = 1, 0, -1
+                            for pos in code_hits:
+                                start = mm.rfind(b'\n', 0, pos) + 1
+                                if start == last_start:
+                                    continue
+                                end = mm.find(b'\n', pos)
+                                if end < 0:
+                                    end = len(mm)
+                                line_no += mm[scanned:start].count(b'\n')
+                                scanned = last_start = start
+                                line = mm[start:end]
+                                if _NAME_WRONG in line:
+                                    text = line.decode('utf-8', errors='replace')
+                                    print(f"    第{line_no}行: {text.strip()}")
                     except Exception:
                         continue
         
@@ -243,22 +286,27 @@ def search_all_files_for_mapping():
         return False
 
 
-def main():
-    """主调试函数"""
+def main(fast: bool = False):
+    """主调试函数
+    
+    Args:
+        fast: 为True时发现第一个错误来源即停止
+    """
     print("🔍 600990股票名称映射调试")
     print("=" * 60)
     print("目标: 找出为什么600990会被错误显示为'四维图新'")
     print("正确: 600990 = 四创电子")
     print("=" * 60)
     
+    # 按开销从小到大排列：内存字典 -> 本地文件 -> 数据库 -> 网络
     tests = [
-        ("china_news_enhanced映射", test_china_news_enhanced_mapping),
-        ("tdx_utils映射", test_tdx_utils_mapping),
         ("_common_stock_names字典", test_common_stock_names),
-        ("agent_utils集成", test_agent_utils_integration),
+        ("china_news_enhanced映射", test_china_news_enhanced_mapping),
         ("Web界面映射", test_web_interface),
-        ("数据库缓存", test_database_cache),
         ("全文件搜索", search_all_files_for_mapping),
+        ("tdx_utils映射", test_tdx_utils_mapping),
+        ("数据库缓存", test_database_cache),
+        ("agent_utils集成", test_agent_utils_integration),
     ]
     
     results = {}
@@ -269,13 +317,17 @@ def main():
         except Exception as e:
             print(f"❌ {test_name} 出现异常: {e}")
             results[test_name] = False
+        
+        if fast and not results[test_name]:
+            print(f"\n⏭️ 快速模式：已定位错误来源，跳过剩余{len(tests) - len(results)}项测试")
+            break
     
     # 总结结果
     print("\n📊 调试结果总结")
     print("=" * 60)
     
     passed = 0
-    total = len(tests)
+    total = len(results)
     error_sources = []
     
     for test_name, success in results.items():
@@ -302,5 +354,9 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="调试600990股票名称映射问题")
+    parser.add_argument("--fast", action="store_true", help="发现第一个错误来源即停止")
+    args = parser.parse_args()
+    
+    success = main(fast=args.fast)
     sys.exit(0 if success else 1)
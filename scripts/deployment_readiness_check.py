@@ -6,17 +6,91 @@ TradingAgents-CN 部署就绪性检查
 """
 
 import os
+import re
 import sys
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 # 添加项目根目录到路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 遍历时跳过的目录
+_SKIP_DIRS = frozenset({"__pycache__", ".git", "node_modules"})
+
+# 硬编码密钥检测规则，合并为一个正则只编译一次
+_SECRET_RE = re.compile(
+    rb"sk-[a-zA-Z0-9]{48}"                  # OpenAI API keys
+    rb"|['\"][a-zA-Z0-9]{32,}['\"]"         # Generic long strings
+    rb"|password\s*=\s*['\"][^'\"]+['\"]"  # Passwords
+)
+
+# 关键依赖与需要被Git忽略的敏感文件
+_CRITICAL_DEPS = frozenset({
+    "langchain", "langgraph", "openai", "requests",
+    "pandas", "numpy", "python-dotenv"
+})
+_SENSITIVE_PATTERNS = frozenset({".env", "*.key", "secrets", "__pycache__"})
+_REQ_NAME_RE = re.compile(r"^\s*([a-z0-9_.\-]+)", re.MULTILINE)
+
+# 文件名关键字 -> 分桶名，目录扫描时一次完成分类
+_CLASSIFY = {
+    "health": "health_files",
+    "config": "config_files",
+    "resource": "resource_files",
+    "limit": "limit_files",
+}
+
+# 文档/可扩展性/优雅关闭检查用到的固定字面量，一次扫描找出全部命中
+_PROBE_RE = re.compile(rb'"""|\'\'\'|async def|await |signal|SIGTERM|SIGINT')
+
+
+def _scandir_recursive(path):
+    """基于os.scandir的递归遍历，跳过符号链接和无关目录"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                yield entry
+                if entry.is_dir(follow_symlinks=False) and entry.name not in _SKIP_DIRS:
+                    yield from _scandir_recursive(entry.path)
+    except OSError:
+        return
+
+
+@dataclass(frozen=True)
+class FileFlags:
+    """单个Python文件的内容检查结果"""
+    path: str
+    has_secret: bool
+    has_doc: bool
+    has_async: bool
+    has_signal_handling: bool
+
+
+def _scan_one(path: str) -> Optional[FileFlags]:
+    """读取单个Python文件一次，在同一份字节上完成全部内容检查"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+    
+    hits = set(_PROBE_RE.findall(raw))
+    return FileFlags(
+        path=path,
+        has_secret=_SECRET_RE.search(raw) is not None,
+        has_doc=b'"""' in hits or b"'''" in hits,
+        has_async=b"async def" in hits or b"await " in hits,
+        has_signal_handling=b"signal" in hits and (b"SIGTERM" in hits or b"SIGINT" in hits),
+    )
+
 
 class DeploymentChecker:
     """部署就绪性检查器"""
@@ -28,6 +102,64 @@ class DeploymentChecker:
         self.recommendations = []
         self.score = 0
         self.max_score = 0
+        self._all_entries = None
+        # 文件内容缓存只在本次检查内有效，新的检查器实例会重新读取
+        self._text_cache = {}
+        # 同一次检查中的问题/警告/建议共用一个时间戳
+        self._now_iso = datetime.now().isoformat()
+    
+    def _scan_tree(self):
+        """单次遍历项目目录，缓存各检查所需的文件列表"""
+        if self._all_entries is not None:
+            return
+        
+        self._all_entries = [
+            entry for entry in _scandir_recursive(self.project_root)
+            if entry.name not in _SKIP_DIRS
+        ]
+        
+        # 单次遍历完成分类，各检查直接读取对应分桶
+        self._py_files = []
+        self.buckets = {bucket: [] for bucket in _CLASSIFY.values()}
+        for entry in self._all_entries:
+            name = entry.name.lower()
+            if name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                self._py_files.append(entry.path)
+            for token, bucket in _CLASSIFY.items():
+                if token in name:
+                    self.buckets[bucket].append(entry.path)
+        
+        # 记录全部相对路径，存在性检查直接查集合，无需逐个stat
+        prefix_len = len(os.path.join(str(self.project_root), ""))
+        self._path_set = {
+            entry.path[prefix_len:].replace(os.sep, "/") for entry in self._all_entries
+        }
+        self._file_scan = None
+    
+    def _read_text(self, path: Path) -> str:
+        """读取文本文件，同一检查器内重复读取同一文件时复用结果"""
+        key = str(path)
+        if key not in self._text_cache:
+            self._text_cache[key] = path.read_text(encoding='utf-8', errors='replace')
+        return self._text_cache[key]
+    
+    def _read_lower(self, path: Path) -> str:
+        """读取文本文件的小写形式"""
+        return self._read_text(path).lower()
+    
+    def _exists(self, rel_path: str) -> bool:
+        """判断项目内相对路径是否存在（基于目录扫描结果）"""
+        self._scan_tree()
+        return rel_path in self._path_set
+    
+    def _scan_files(self):
+        """并发读取全部Python文件（I/O密集），一次得到各项内容检查的结果"""
+        self._scan_tree()
+        if self._file_scan is None:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(_scan_one, self._py_files)
+                self._file_scan = [r for r in results if r is not None]
+        return self._file_scan
     
     def add_issue(self, category: str, message: str, severity: str = "high"):
         """添加问题"""
@@ -35,7 +167,7 @@ class DeploymentChecker:
             "category": category,
             "message": message,
             "severity": severity,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso
         })
     
     def add_warning(self, category: str, message: str):
@@ -43,7 +175,7 @@ class DeploymentChecker:
         self.warnings.append({
             "category": category,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso
         })
     
     def add_recommendation(self, category: str, message: str):
@@ -51,7 +183,7 @@ class DeploymentChecker:
         self.recommendations.append({
             "category": category,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self._now_iso
         })
     
     def check_score(self, points: int, condition: bool, category: str, success_msg: str, fail_msg: str):
@@ -70,18 +202,16 @@ class DeploymentChecker:
         
         # 检查requirements.txt
         req_file = self.project_root / "requirements.txt"
-        self.check_score(5, req_file.exists(), "dependencies", 
+        self.check_score(5, self._exists("requirements.txt"), "dependencies", 
                         "requirements.txt 文件存在", "缺少 requirements.txt 文件")
         
         # 检查关键依赖
-        critical_deps = [
-            "langchain", "langgraph", "openai", "requests", 
-            "pandas", "numpy", "python-dotenv"
-        ]
-        
-        if req_file.exists():
-            content = req_file.read_text()
-            missing_deps = [dep for dep in critical_deps if dep not in content.lower()]
+        if self._exists("requirements.txt"):
+            content = self._read_lower(req_file)
+            # 一次解析出全部包名，并补上包族前缀（langchain-openai -> langchain）
+            names = {name.replace("_", "-") for name in _REQ_NAME_RE.findall(content)}
+            names |= {name.split("-", 1)[0] for name in names}
+            missing_deps = sorted(_CRITICAL_DEPS - names)
             
             self.check_score(10, len(missing_deps) == 0, "dependencies",
                            "所有关键依赖项已定义", f"缺少关键依赖: {missing_deps}")
@@ -99,10 +229,9 @@ class DeploymentChecker:
         print("\n⚙️ 检查配置管理...")
         
         # 检查环境变量配置
-        env_example = self.project_root / ".env.example"
         env_file = self.project_root / ".env"
         
-        self.check_score(5, env_example.exists(), "configuration",
+        self.check_score(5, self._exists(".env.example"), "configuration",
                         ".env.example 文件存在", "缺少 .env.example 文件")
         
         # 检查配置文件
@@ -111,14 +240,14 @@ class DeploymentChecker:
             "tradingagents/config/config_manager.py"
         ]
         
-        existing_configs = sum(1 for f in config_files if (self.project_root / f).exists())
+        existing_configs = sum(1 for f in config_files if self._exists(f))
         self.check_score(10, existing_configs >= 1, "configuration",
                         "配置管理文件存在", "缺少配置管理文件")
         
         # 检查敏感信息
-        if env_file.exists():
-            content = env_file.read_text()
-            if "your_api_key_here" in content or "placeholder" in content.lower():
+        if self._exists(".env"):
+            content = self._read_lower(env_file)
+            if "your_api_key_here" in content or "placeholder" in content:
                 self.add_warning("configuration", "环境变量文件包含占位符，需要配置真实值")
         
         return {"score": 15, "max_score": 15}
@@ -128,16 +257,15 @@ class DeploymentChecker:
         print("\n🔒 检查安全性...")
         
         # 检查安全模块
-        security_file = self.project_root / "tradingagents/core/security.py"
-        self.check_score(10, security_file.exists(), "security",
+        self.check_score(10, self._exists("tradingagents/core/security.py"), "security",
                         "安全模块已实现", "缺少安全模块")
         
         # 检查敏感文件是否被忽略
         gitignore = self.project_root / ".gitignore"
-        if gitignore.exists():
-            content = gitignore.read_text()
-            sensitive_patterns = [".env", "*.key", "secrets", "__pycache__"]
-            ignored_patterns = sum(1 for pattern in sensitive_patterns if pattern in content)
+        if self._exists(".gitignore"):
+            content = self._read_text(gitignore)
+            lines = frozenset(line.strip().rstrip("/") for line in content.splitlines())
+            ignored_patterns = len(_SENSITIVE_PATTERNS & lines)
             
             self.check_score(5, ignored_patterns >= 3, "security",
                            "敏感文件已被Git忽略", "部分敏感文件可能未被忽略")
@@ -151,29 +279,14 @@ class DeploymentChecker:
     
     def check_hardcoded_secrets(self):
         """检查硬编码密钥"""
-        secret_patterns = [
-            r"sk-[a-zA-Z0-9]{48}",  # OpenAI API keys
-            r"['\"][a-zA-Z0-9]{32,}['\"]",  # Generic long strings
-            r"password\s*=\s*['\"][^'\"]+['\"]",  # Passwords
-        ]
-        
-        python_files = list(self.project_root.rglob("*.py"))
         issues_found = 0
         
-        for file_path in python_files:
-            if "test" in str(file_path) or "__pycache__" in str(file_path):
-                continue
-                
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                for pattern in secret_patterns:
-                    import re
-                    if re.search(pattern, content):
-                        issues_found += 1
-                        self.add_warning("security", f"可能的硬编码密钥: {file_path}")
-                        break
-            except:
+        for flags in self._scan_files():
+            if "test" in flags.path:
                 continue
+            if flags.has_secret:
+                issues_found += 1
+                self.add_warning("security", f"可能的硬编码密钥: {flags.path}")
         
         self.check_score(5, issues_found == 0, "security",
                         "未发现硬编码密钥", f"发现 {issues_found} 个可能的硬编码密钥")
@@ -183,18 +296,15 @@ class DeploymentChecker:
         print("\n🛡️ 检查错误处理...")
         
         # 检查异常处理模块
-        exception_file = self.project_root / "tradingagents/core/exceptions.py"
-        self.check_score(10, exception_file.exists(), "error_handling",
+        self.check_score(10, self._exists("tradingagents/core/exceptions.py"), "error_handling",
                         "异常处理模块已实现", "缺少异常处理模块")
         
         # 检查装饰器
-        decorator_file = self.project_root / "tradingagents/core/decorators.py"
-        self.check_score(5, decorator_file.exists(), "error_handling",
+        self.check_score(5, self._exists("tradingagents/core/decorators.py"), "error_handling",
                         "错误处理装饰器已实现", "缺少错误处理装饰器")
         
         # 检查日志配置
-        logging_file = self.project_root / "tradingagents/core/logging_config.py"
-        self.check_score(5, logging_file.exists(), "error_handling",
+        self.check_score(5, self._exists("tradingagents/core/logging_config.py"), "error_handling",
                         "日志配置已实现", "缺少日志配置")
         
         return {"score": 20, "max_score": 20}
@@ -204,13 +314,11 @@ class DeploymentChecker:
         print("\n📊 检查监控能力...")
         
         # 检查监控模块
-        monitoring_file = self.project_root / "tradingagents/core/monitoring.py"
-        self.check_score(10, monitoring_file.exists(), "monitoring",
+        self.check_score(10, self._exists("tradingagents/core/monitoring.py"), "monitoring",
                         "监控模块已实现", "缺少监控模块")
         
         # 检查性能监控
-        performance_file = self.project_root / "tradingagents/core/performance.py"
-        self.check_score(5, performance_file.exists(), "monitoring",
+        self.check_score(5, self._exists("tradingagents/core/performance.py"), "monitoring",
                         "性能监控已实现", "缺少性能监控")
         
         return {"score": 15, "max_score": 15}
@@ -221,24 +329,24 @@ class DeploymentChecker:
         
         # 检查测试目录
         test_dir = self.project_root / "tests"
-        self.check_score(5, test_dir.exists(), "testing",
+        self.check_score(5, self._exists("tests"), "testing",
                         "测试目录存在", "缺少测试目录")
         
         # 检查测试文件
-        if test_dir.exists():
+        if self._exists("tests"):
             test_files = list(test_dir.glob("test_*.py"))
             self.check_score(10, len(test_files) >= 3, "testing",
                            f"测试文件充足 ({len(test_files)} 个)", "测试文件不足")
         
-        # 运行测试
+        # 运行测试：放在独立子进程中并限时，避免网络相关测试挂起检查器或污染其进程状态
         try:
             result = subprocess.run([
-                sys.executable, "-m", "pytest", "--tb=short", "-v"
+                sys.executable, "-m", "pytest", "--tb=short", "-q"
             ], cwd=self.project_root, capture_output=True, text=True, timeout=60)
             
             self.check_score(10, result.returncode == 0, "testing",
                            "所有测试通过", "部分测试失败")
-        except:
+        except Exception:
             self.add_warning("testing", "无法运行pytest，尝试手动测试")
             # 尝试运行我们的测试框架
             try:
@@ -248,7 +356,7 @@ class DeploymentChecker:
                 
                 self.check_score(10, result.returncode == 0, "testing",
                                "测试框架运行成功", "测试框架运行失败")
-            except:
+            except Exception:
                 self.add_issue("testing", "无法运行测试")
         
         return {"score": 25, "max_score": 25}
@@ -259,30 +367,22 @@ class DeploymentChecker:
         
         # 检查README
         readme_files = ["README.md", "README.rst", "README.txt"]
-        has_readme = any((self.project_root / f).exists() for f in readme_files)
+        has_readme = any(self._exists(f) for f in readme_files)
         self.check_score(5, has_readme, "documentation",
                         "README文件存在", "缺少README文件")
         
         # 检查API文档
-        docs_dir = self.project_root / "docs"
-        self.check_score(3, docs_dir.exists(), "documentation",
+        self.check_score(3, self._exists("docs"), "documentation",
                         "文档目录存在", "建议添加docs目录")
         
         # 检查代码注释
-        python_files = list(self.project_root.rglob("*.py"))
-        documented_files = 0
+        file_scan = self._scan_files()
+        documented_files = sum(
+            1 for flags in file_scan
+            if flags.has_doc and "test" not in flags.path
+        )
         
-        for file_path in python_files:
-            if "test" in str(file_path) or "__pycache__" in str(file_path):
-                continue
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                if '"""' in content or "'''" in content:
-                    documented_files += 1
-            except:
-                continue
-        
-        doc_ratio = documented_files / max(len(python_files), 1)
+        doc_ratio = documented_files / max(len(file_scan), 1)
         self.check_score(7, doc_ratio >= 0.5, "documentation",
                         f"代码文档充足 ({doc_ratio:.1%})", f"代码文档不足 ({doc_ratio:.1%})")
         
@@ -293,10 +393,8 @@ class DeploymentChecker:
         print("\n🚀 检查部署文件...")
         
         # 检查Docker支持
-        dockerfile = self.project_root / "Dockerfile"
-        docker_compose = self.project_root / "docker-compose.yml"
         
-        has_docker = dockerfile.exists() or docker_compose.exists()
+        has_docker = self._exists("Dockerfile") or self._exists("docker-compose.yml")
         if has_docker:
             self.check_score(5, True, "deployment", "Docker配置存在", "")
         else:
@@ -304,13 +402,13 @@ class DeploymentChecker:
         
         # 检查启动脚本
         startup_scripts = ["start.sh", "run.py", "main.py", "app.py"]
-        has_startup = any((self.project_root / f).exists() for f in startup_scripts)
+        has_startup = any(self._exists(f) for f in startup_scripts)
         self.check_score(5, has_startup, "deployment",
                         "启动脚本存在", "缺少启动脚本")
         
         # 检查健康检查端点
-        health_files = list(self.project_root.rglob("*health*"))
-        has_health_check = len(health_files) > 0
+        self._scan_tree()
+        has_health_check = len(self.buckets["health_files"]) > 0
         if has_health_check:
             self.check_score(3, True, "deployment", "健康检查已实现", "")
         else:
@@ -323,26 +421,22 @@ class DeploymentChecker:
         print("\n📈 检查可扩展性...")
         
         # 检查异步支持
-        async_files = []
-        for file_path in self.project_root.rglob("*.py"):
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                if "async def" in content or "await " in content:
-                    async_files.append(file_path)
-            except:
-                continue
+        async_files = [
+            flags.path for flags in self._scan_files()
+            if flags.has_async
+        ]
         
         self.check_score(5, len(async_files) > 0, "scalability",
                         f"异步支持已实现 ({len(async_files)} 个文件)", "缺少异步支持")
         
-        # 检查缓存机制
-        cache_files = list(self.project_root.rglob("*cache*"))
-        self.check_score(5, len(cache_files) > 0, "scalability",
+        # 检查缓存机制（复用目录扫描结果，命中即停）
+        has_cache = any("cache" in entry.name for entry in self._all_entries)
+        self.check_score(5, has_cache, "scalability",
                         "缓存机制已实现", "缺少缓存机制")
         
-        # 检查数据库连接池
-        db_files = list(self.project_root.rglob("*database*")) + list(self.project_root.rglob("*db*"))
-        if db_files:
+        # 检查数据库连接池（文件名含 database 或 db）
+        has_db = any("database" in entry.name or "db" in entry.name for entry in self._all_entries)
+        if has_db:
             self.check_score(3, True, "scalability", "数据库支持已实现", "")
         else:
             self.add_recommendation("scalability", "考虑添加数据库支持以提高可扩展性")
@@ -354,28 +448,19 @@ class DeploymentChecker:
         print("\n🏭 检查生产就绪性...")
         
         # 检查环境区分
-        config_files = list(self.project_root.rglob("*config*"))
-        has_env_config = any("env" in str(f).lower() for f in config_files)
+        self._scan_tree()
+        has_env_config = any("env" in f.lower() for f in self.buckets["config_files"])
         self.check_score(5, has_env_config, "production",
                         "环境配置已区分", "缺少环境配置区分")
         
         # 检查资源限制
-        resource_files = list(self.project_root.rglob("*resource*")) + list(self.project_root.rglob("*limit*"))
-        if resource_files:
+        if self.buckets["resource_files"] or self.buckets["limit_files"]:
             self.check_score(3, True, "production", "资源限制已配置", "")
         else:
             self.add_recommendation("production", "建议配置资源限制")
         
         # 检查优雅关闭
-        signal_handling = False
-        for file_path in self.project_root.rglob("*.py"):
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                if "signal" in content and ("SIGTERM" in content or "SIGINT" in content):
-                    signal_handling = True
-                    break
-            except:
-                continue
+        signal_handling = any(flags.has_signal_handling for flags in self._scan_files())
         
         if signal_handling:
             self.check_score(2, True, "production", "优雅关闭已实现", "")
@@ -440,6 +525,10 @@ class DeploymentChecker:
         """运行完整检查"""
         print("🔍 开始TradingAgents-CN部署就绪性检查...")
         print("=" * 60)
+        self._now_iso = datetime.now().isoformat()
+        
+        # 单次遍历项目目录，供后续检查复用
+        self._scan_tree()
         
         # 执行各项检查
         self.check_dependencies()
@@ -464,8 +553,13 @@ def main():
     
     # 保存报告
     report_file = project_root / "deployment_readiness_report.json"
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    try:
+        import orjson
+        
+        report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
     
     print(f"\n📄 详细报告已保存: {report_file}")
     
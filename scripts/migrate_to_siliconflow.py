@@ -6,8 +6,10 @@
 """
 
 import os
+import re
 import sys
 import shutil
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -15,6 +17,35 @@ from typing import Dict, List, Optional
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 用户配置文件中的替换规则，合并为一个正则单次扫描完成全部替换
+_CONFIG_SUBS = {
+    '"llm_provider": "dashscope"': '"llm_provider": "siliconflow"',
+    '"deep_think_llm": "qwen-plus"': '"deep_think_llm": "deepseek-ai/DeepSeek-V3"',
+    '"quick_think_llm": "qwen-turbo"': '"quick_think_llm": "deepseek-ai/DeepSeek-V3"',
+}
+_CONFIG_PAT = re.compile("|".join(re.escape(key) for key in _CONFIG_SUBS))
+_CONFIG_NEEDLES = tuple(key.encode('utf-8') for key in _CONFIG_SUBS)
+_CONFIG_SUFFIXES = (".json", ".yaml")
+
+# .env迁移：一个正则同时完成密钥检测与默认提供商替换
+_ENV_PAT = re.compile(r'(?P<key>SILICONFLOW_API_KEY)|DEFAULT_LLM_PROVIDER=dashscope')
+
+
+def _atomic_write_text(path, content: str):
+    """先写临时文件再原子替换，中途失败不会留下写了一半的配置"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if path.exists():
+            # 保留原文件权限（如.env常为600）
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class SiliconFlowMigrator:
     """硅基流动迁移器"""
@@ -23,12 +54,19 @@ class SiliconFlowMigrator:
         self.project_root = project_root
         self.backup_dir = self.project_root / "backup_before_migration"
         self.migration_log = []
+        self._flushed = 0
         
     def log(self, message: str, level: str = "INFO"):
-        """记录迁移日志"""
-        log_entry = f"[{level}] {message}"
-        self.migration_log.append(log_entry)
-        print(log_entry)
+        """记录迁移日志（先缓冲，由flush_log统一输出）"""
+        self.migration_log.append(f"[{level}] {message}")
+    
+    def flush_log(self):
+        """一次写出尚未输出的日志"""
+        pending = self.migration_log[self._flushed:]
+        if pending:
+            sys.stdout.write("\n".join(pending) + "\n")
+            sys.stdout.flush()
+            self._flushed = len(self.migration_log)
     
     def backup_files(self, files: List[Path]):
         """备份文件"""
@@ -83,20 +121,30 @@ class SiliconFlowMigrator:
             with open(env_file, 'r', encoding='utf-8') as f:
                 content = f.read()
             
+            # 单次扫描：更新默认提供商，同时检测是否已配置硅基流动密钥
+            has_key = False
+            
+            def _replace(match):
+                nonlocal has_key
+                if match.group('key'):
+                    has_key = True
+                    return match.group(0)
+                return 'DEFAULT_LLM_PROVIDER=siliconflow'
+            
+            new_content = _ENV_PAT.sub(_replace, content)
+            
             # 添加硅基流动配置
-            if 'SILICONFLOW_API_KEY' not in content:
+            if not has_key:
                 siliconflow_key = os.getenv('SILICONFLOW_API_KEY', '')
-                content += f"\n# 硅基流动API密钥\nSILICONFLOW_API_KEY={siliconflow_key}\n"
+                new_content += f"\n# 硅基流动API密钥\nSILICONFLOW_API_KEY={siliconflow_key}\n"
             
-            # 更新默认提供商
-            content = content.replace(
-                'DEFAULT_LLM_PROVIDER=dashscope',
-                'DEFAULT_LLM_PROVIDER=siliconflow'
-            )
+            # 内容未变化时不重写文件，避免无谓地更新mtime
+            if new_content == content:
+                self.log("✅ .env 文件已是最新，无需更新")
+                return
             
             # 写回文件
-            with open(env_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _atomic_write_text(env_file, new_content)
             
             self.log("✅ 已更新 .env 文件")
         else:
@@ -109,6 +157,8 @@ class SiliconFlowMigrator:
         try:
             from tradingagents.llm_adapters.siliconflow_adapter import test_siliconflow_connection
             
+            # 连接测试会直接打印输出且耗时较长，先写出之前各步骤的日志以保持顺序
+            self.flush_log()
             if test_siliconflow_connection():
                 self.log("✅ 硅基流动连接测试成功")
                 return True
@@ -131,39 +181,52 @@ class SiliconFlowMigrator:
         ]
         
         for config_dir in config_dirs:
-            if config_dir.exists():
-                config_files = list(config_dir.glob("*.json")) + list(config_dir.glob("*.yaml"))
-                for config_file in config_files:
-                    try:
-                        content = config_file.read_text(encoding='utf-8')
-                        
-                        # 替换配置
-                        content = content.replace('"llm_provider": "dashscope"', '"llm_provider": "siliconflow"')
-                        content = content.replace('"deep_think_llm": "qwen-plus"', '"deep_think_llm": "deepseek-ai/DeepSeek-V3"')
-                        content = content.replace('"quick_think_llm": "qwen-turbo"', '"quick_think_llm": "deepseek-ai/DeepSeek-V3"')
-                        
-                        config_file.write_text(content, encoding='utf-8')
-                        self.log(f"✅ 已更新配置文件: {config_file.name}")
-                    except Exception as e:
-                        self.log(f"⚠️ 更新配置文件失败 {config_file.name}: {e}", "WARN")
+            # 单次scandir按后缀筛选，替代两次glob遍历
+            try:
+                with os.scandir(config_dir) as entries:
+                    config_files = [
+                        entry for entry in entries
+                        if entry.name.endswith(_CONFIG_SUFFIXES) and entry.is_file(follow_symlinks=False)
+                    ]
+            except OSError:
+                continue
+            
+            for config_file in config_files:
+                try:
+                    with open(config_file.path, 'rb') as f:
+                        raw = f.read()
+                    # 不含任何待替换项的文件直接跳过，避免无谓的解码和重写
+                    if not any(needle in raw for needle in _CONFIG_NEEDLES):
+                        continue
+                    content = raw.decode('utf-8')
+                    
+                    # 替换配置，没有发生替换时不重写文件
+                    content, replaced = _CONFIG_PAT.subn(lambda m: _CONFIG_SUBS[m.group(0)], content)
+                    if replaced == 0:
+                        continue
+                    
+                    _atomic_write_text(config_file.path, content)
+                    self.log(f"✅ 已更新配置文件: {config_file.name}")
+                except Exception as e:
+                    self.log(f"⚠️ 更新配置文件失败 {config_file.name}: {e}", "WARN")
     
     def generate_migration_report(self):
         """生成迁移报告"""
         self.log("📊 生成迁移报告...")
         
-        report_content = f"""
+        parts = [f"""
 # 硅基流动迁移报告
 
 ## 迁移时间
-{os.popen('date').read().strip()}
+{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## 迁移日志
-"""
+"""]
         
-        for log_entry in self.migration_log:
-            report_content += f"{log_entry}\n"
+        if self.migration_log:
+            parts.append("\n".join(self.migration_log) + "\n")
         
-        report_content += """
+        parts.append("""
 
 ## 迁移后配置
 
@@ -205,14 +268,21 @@ state, decision = ta.propagate("AAPL", "2024-12-20")
 - 硅基流动配置指南: docs/configuration/siliconflow-config.md
 - 示例代码: examples/siliconflow_examples/
 - 测试脚本: tests/test_siliconflow_integration.py
-"""
+""")
         
         report_file = self.project_root / "migration_report.md"
-        report_file.write_text(report_content, encoding='utf-8')
+        _atomic_write_text(report_file, "".join(parts))
         self.log(f"✅ 迁移报告已生成: {report_file}")
     
     def run_migration(self):
         """执行完整迁移"""
+        try:
+            return self._run_migration()
+        finally:
+            self.flush_log()
+    
+    def _run_migration(self):
+        """迁移各步骤"""
         self.log("🚀 开始硅基流动迁移...")
         self.log("=" * 60)
         
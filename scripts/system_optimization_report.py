@@ -6,28 +6,122 @@ TradingAgents-CN 系统优化报告生成器
 """
 
 import os
+import argparse
 import sys
 import time
 import json
+import hashlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 # 添加项目根目录到路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from tradingagents.core.logging_config import get_logger
-from tradingagents.core.monitoring import get_monitor
-from tradingagents.core.security import get_security_auditor
-from tradingagents.core.performance import get_system_performance
+# 结果缓存目录（源码未变化时复用上一次的结果）
+_CACHE_DIR = project_root / ".cache"
+_COVERAGE_CACHE = _CACHE_DIR / "coverage.json"
+_TEST_RESULTS_CACHE = _CACHE_DIR / "system_report.json"
+_SIGNATURE_DIRS = ("tradingagents", "tests")
 
 
-def run_test_suite() -> Dict[str, Any]:
-    """运行测试套件并收集结果"""
+def _iter_py_stats(path: str):
+    """基于os.scandir递归产出 (路径, mtime_ns, size)，DirEntry自带stat缓存"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        yield from _iter_py_stats(entry.path)
+                elif entry.name.endswith(".py"):
+                    st = entry.stat(follow_symlinks=False)
+                    yield entry.path, st.st_mtime_ns, st.st_size
+    except OSError:
+        return
+
+
+def _source_signature() -> str:
+    """根据源码与测试文件的路径/mtime/大小计算签名，任一文件变化即失效"""
+    digest = hashlib.blake2b(digest_size=16)
+    for dir_name in _SIGNATURE_DIRS:
+        for path, mtime_ns, size in sorted(_iter_py_stats(str(project_root / dir_name))):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_cached(cache_file: Path, signature: str) -> Optional[Dict[str, Any]]:
+    """签名一致时返回缓存内容，否则返回None"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get("signature") != signature:
+        return None
+    return cached.get("data")
+
+
+def _save_cached(cache_file: Path, signature: str, data: Dict[str, Any]):
+    """写入缓存，失败时忽略（缓存只是加速手段）"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"signature": signature, "data": data}, f, ensure_ascii=False, default=str)
+    except OSError:
+        pass
+
+
+def _run_test_file(test_file: str) -> Dict[str, Any]:
+    """在独立子进程中运行单个测试文件"""
+    test_path = project_root / "tests" / test_file
+    if not test_path.exists():
+        return {
+            "passed": False,
+            "error": f"Test file not found: {test_file}"
+        }
+    
+    try:
+        # 只需要返回码和错误信息，标准输出直接丢弃，避免缓冲大量测试日志
+        result = subprocess.run(
+            [sys.executable, str(test_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=str(project_root),
+            timeout=300
+        )
+        
+        return {
+            "passed": result.returncode == 0,
+            "error": result.stderr if result.stderr else None
+        }
+        
+    except Exception as e:
+        return {
+            "passed": False,
+            "error": str(e)
+        }
+
+
+def run_test_suite(signature: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """运行测试套件并收集结果
+    
+    Args:
+        signature: 源码签名，与上次运行一致时直接复用缓存结果
+        force: 为True时忽略缓存，重新运行测试
+    """
     print("🧪 运行测试套件...")
     
-    test_results = {}
+    signature = signature or _source_signature()
+    cached = None if force else _load_cached(_TEST_RESULTS_CACHE, signature)
+    if cached is not None:
+        print("  ♻️ 源码与测试未变化，复用缓存的测试结果")
+        return cached
+    
     test_files = [
         "test_error_handling.py",
         "test_monitoring_logging.py", 
@@ -36,69 +130,73 @@ def run_test_suite() -> Dict[str, Any]:
         "test_performance.py"
     ]
     
-    for test_file in test_files:
-        test_path = project_root / "tests" / test_file
-        if test_path.exists():
-            try:
-                # 运行测试
-                import subprocess
-                result = subprocess.run(
-                    [sys.executable, str(test_path)],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(project_root)
-                )
-                
-                test_results[test_file] = {
-                    "passed": result.returncode == 0,
-                    "output": result.stdout,
-                    "error": result.stderr if result.stderr else None
-                }
-                
-            except Exception as e:
-                test_results[test_file] = {
-                    "passed": False,
-                    "output": "",
-                    "error": str(e)
-                }
-        else:
-            test_results[test_file] = {
-                "passed": False,
-                "output": "",
-                "error": f"Test file not found: {test_file}"
-            }
+    # 各测试文件在独立子进程中并发运行，每个进程限时，避免挂起或污染报告进程
+    completed = {}
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        futures = {executor.submit(_run_test_file, f): f for f in test_files}
+        for future in as_completed(futures):
+            completed[futures[future]] = future.result()
+    
+    # 保持与test_files一致的顺序
+    test_results = {test_file: completed[test_file] for test_file in test_files}
     
+    # 失败可能源于环境（缺少API密钥、服务不可用、依赖升级等），与源码签名无关，不缓存
+    if all(result["passed"] for result in test_results.values()):
+        _save_cached(_TEST_RESULTS_CACHE, signature, test_results)
     return test_results
 
 
-def analyze_code_coverage() -> Dict[str, Any]:
-    """分析代码覆盖率"""
+def analyze_code_coverage(signature: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """分析代码覆盖率
+    
+    Args:
+        signature: 源码签名，与上次运行一致时直接复用缓存结果
+        force: 为True时忽略缓存，重新分析
+    """
     print("📊 分析代码覆盖率...")
     
+    # 源码和测试均未变化时直接复用上一次的覆盖率结果
+    signature = signature or _source_signature()
+    cached = None if force else _load_cached(_COVERAGE_CACHE, signature)
+    if cached is not None:
+        print("  ♻️ 源码未变化，复用缓存的覆盖率结果")
+        return cached
+    
     try:
-        # 运行覆盖率分析
-        import subprocess
+        json_report_path = project_root / "coverage_report.json"
+        try:
+            previous_mtime = os.stat(json_report_path).st_mtime_ns
+        except OSError:
+            previous_mtime = None
+        
+        # 运行覆盖率分析；本函数已按源码签名缓存，子进程总是强制重新分析以确保写出新报告
+        # 结果从生成的JSON报告中读取，子进程输出无需保留
         result = subprocess.run(
-            [sys.executable, "scripts/test_coverage_report.py"],
-            capture_output=True,
-            text=True,
+            [sys.executable, "scripts/test_coverage_report.py", "--force"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=str(project_root)
         )
         
-        # 尝试读取JSON报告
-        json_report_path = project_root / "coverage_report.json"
-        if json_report_path.exists():
-            with open(json_report_path, 'r', encoding='utf-8') as f:
-                coverage_data = json.load(f)
-            return coverage_data
-        else:
+        # 返回码0/1分别表示覆盖率达标/未达标，其他返回码或报告未被重写说明运行失败，
+        # 此时磁盘上的JSON可能是旧报告，不能读取也不能缓存
+        try:
+            current_mtime = os.stat(json_report_path).st_mtime_ns
+        except OSError:
+            current_mtime = None
+        if result.returncode not in (0, 1) or current_mtime is None or current_mtime == previous_mtime:
             return {
                 "overall_coverage": 0,
                 "total_modules": 0,
                 "tested_modules": 0,
-                "error": "Coverage report not generated"
+                "error": f"Coverage report not generated (exit code {result.returncode})"
             }
-            
+        
+        with open(json_report_path, 'r', encoding='utf-8') as f:
+            coverage_data = json.load(f)
+        _save_cached(_COVERAGE_CACHE, signature, coverage_data)
+        return coverage_data
+        
     except Exception as e:
         return {
             "overall_coverage": 0,
@@ -113,6 +211,8 @@ def check_security_status() -> Dict[str, Any]:
     print("🔒 检查安全状态...")
     
     try:
+        from tradingagents.core.security import get_security_auditor
+        
         auditor = get_security_auditor()
         
         # 检查环境安全
@@ -141,6 +241,8 @@ def check_performance_status() -> Dict[str, Any]:
     print("⚡ 检查性能状态...")
     
     try:
+        from tradingagents.core.performance import get_system_performance
+        
         performance_data = get_system_performance()
         
         # 性能评级
@@ -175,6 +277,8 @@ def check_monitoring_status() -> Dict[str, Any]:
     print("📊 检查监控状态...")
     
     try:
+        from tradingagents.core.monitoring import get_monitor
+        
         monitor = get_monitor()
         
         # 获取健康状态
@@ -198,13 +302,22 @@ def check_monitoring_status() -> Dict[str, Any]:
         }
 
 
-def generate_optimization_recommendations(report_data: Dict[str, Any]) -> List[str]:
+def summarize_tests(test_results: Dict[str, Any]) -> Tuple[int, int, List[str]]:
+    """单次遍历测试结果，返回 (通过数, 总数, 失败测试列表)"""
+    failed_tests = [name for name, result in test_results.items() if not result.get("passed", False)]
+    total_tests = len(test_results)
+    return total_tests - len(failed_tests), total_tests, failed_tests
+
+
+def generate_optimization_recommendations(report_data: Dict[str, Any],
+                                          test_summary: Optional[Tuple[int, int, List[str]]] = None) -> List[str]:
     """生成优化建议"""
     recommendations = []
     
     # 测试相关建议
-    test_results = report_data.get("test_results", {})
-    failed_tests = [name for name, result in test_results.items() if not result.get("passed", False)]
+    if test_summary is None:
+        test_summary = summarize_tests(report_data.get("test_results") or {})
+    _, _, failed_tests = test_summary
     if failed_tests:
         recommendations.append(f"修复失败的测试: {', '.join(failed_tests)}")
     
@@ -220,10 +333,10 @@ def generate_optimization_recommendations(report_data: Dict[str, Any]) -> List[s
         recommendations.append(f"修复安全问题: {len(env_issues)}个环境安全问题")
     
     # 性能相关建议
-    performance = report_data.get("performance_status", {})
-    if performance.get("overall_status") == "critical":
+    perf_status = report_data.get("performance_status", {}).get("overall_status")
+    if perf_status == "critical":
         recommendations.append("紧急优化系统性能 - CPU或内存使用率过高")
-    elif performance.get("overall_status") == "warning":
+    elif perf_status == "warning":
         recommendations.append("优化系统性能 - CPU或内存使用率较高")
     
     # 监控相关建议
@@ -237,21 +350,71 @@ def generate_optimization_recommendations(report_data: Dict[str, Any]) -> List[s
     return recommendations
 
 
-def generate_html_report(report_data: Dict[str, Any], output_path: Path):
+# 性能状态 -> 评分
+_PERF_SCORE = {"good": 100, "warning": 70, "critical": 30, "error": 0, "unknown": 50}
+
+# HTML报告的静态部分（样式、页头、页尾），模块加载时构建一次
+_HTML_HEAD = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>TradingAgents-CN 系统优化报告</title>
+        <meta charset="utf-8">
+        <style>
+            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+            .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+            .header { text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }
+            .score { font-size: 48px; font-weight: bold; margin: 20px 0; }
+            .score.excellent { color: #28a745; }
+            .score.good { color: #17a2b8; }
+            .score.warning { color: #ffc107; }
+            .score.critical { color: #dc3545; }
+            .section { margin: 30px 0; padding: 20px; border-radius: 8px; }
+            .section h2 { margin-top: 0; color: #333; border-bottom: 2px solid #eee; padding-bottom: 10px; }
+            .status-good { background-color: #d4edda; border-left: 4px solid #28a745; }
+            .status-warning { background-color: #fff3cd; border-left: 4px solid #ffc107; }
+            .status-critical { background-color: #f8d7da; border-left: 4px solid #dc3545; }
+            .metric { display: inline-block; margin: 10px; padding: 15px; background: #f8f9fa; border-radius: 5px; min-width: 150px; text-align: center; }
+            .recommendations { background-color: #e7f3ff; border-left: 4px solid #007bff; }
+            .recommendations ul { margin: 10px 0; }
+            .recommendations li { margin: 5px 0; }
+            table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+            th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+            th { background-color: #f8f9fa; font-weight: bold; }
+            .test-passed { color: #28a745; }
+            .test-failed { color: #dc3545; }
+        </style>
+    </head>
+    <body>
+        <div class="container">"""
+
+_HTML_FOOTER = """
+                </ul>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+def generate_html_report(report_data: Dict[str, Any], output_path: Path,
+                         test_summary: Optional[Tuple[int, int, List[str]]] = None):
     """生成HTML报告"""
     
     # 计算总体评分
     scores = []
     
     # 测试评分 (30%)
-    test_results = report_data.get("test_results", {})
-    passed_tests = sum(1 for result in test_results.values() if result.get("passed", False))
-    total_tests = len(test_results)
+    test_results = report_data.get("test_results") or {}
+    if test_summary is None:
+        test_summary = summarize_tests(test_results)
+    passed_tests, total_tests, _ = test_summary
     test_score = (passed_tests / total_tests * 100) if total_tests > 0 else 0
     scores.append(test_score * 0.3)
     
     # 覆盖率评分 (25%)
-    coverage_score = report_data.get("code_coverage", {}).get("overall_coverage", 0)
+    coverage = report_data.get("code_coverage", {})
+    coverage_score = coverage.get("overall_coverage", 0)
     scores.append(coverage_score * 0.25)
     
     # 安全评分 (25%)
@@ -262,54 +425,22 @@ def generate_html_report(report_data: Dict[str, Any], output_path: Path):
     # 性能评分 (20%)
     performance = report_data.get("performance_status", {})
     perf_status = performance.get("overall_status", "unknown")
-    perf_score = {"good": 100, "warning": 70, "critical": 30, "error": 0, "unknown": 50}.get(perf_status, 50)
+    perf_score = _PERF_SCORE.get(perf_status, 50)
     scores.append(perf_score * 0.2)
     
     overall_score = sum(scores)
     
     # 生成HTML
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>TradingAgents-CN 系统优化报告</title>
-        <meta charset="utf-8">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-            .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .header {{ text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; }}
-            .score {{ font-size: 48px; font-weight: bold; margin: 20px 0; }}
-            .score.excellent {{ color: #28a745; }}
-            .score.good {{ color: #17a2b8; }}
-            .score.warning {{ color: #ffc107; }}
-            .score.critical {{ color: #dc3545; }}
-            .section {{ margin: 30px 0; padding: 20px; border-radius: 8px; }}
-            .section h2 {{ margin-top: 0; color: #333; border-bottom: 2px solid #eee; padding-bottom: 10px; }}
-            .status-good {{ background-color: #d4edda; border-left: 4px solid #28a745; }}
-            .status-warning {{ background-color: #fff3cd; border-left: 4px solid #ffc107; }}
-            .status-critical {{ background-color: #f8d7da; border-left: 4px solid #dc3545; }}
-            .metric {{ display: inline-block; margin: 10px; padding: 15px; background: #f8f9fa; border-radius: 5px; min-width: 150px; text-align: center; }}
-            .recommendations {{ background-color: #e7f3ff; border-left: 4px solid #007bff; }}
-            .recommendations ul {{ margin: 10px 0; }}
-            .recommendations li {{ margin: 5px 0; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-            th {{ background-color: #f8f9fa; font-weight: bold; }}
-            .test-passed {{ color: #28a745; }}
-            .test-failed {{ color: #dc3545; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
+    parts = [_HTML_HEAD, f"""
             <div class="header">
                 <h1>🚀 TradingAgents-CN 系统优化报告</h1>
                 <p>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
                 <div class="score {'excellent' if overall_score >= 90 else 'good' if overall_score >= 80 else 'warning' if overall_score >= 60 else 'critical'}">{overall_score:.1f}/100</div>
             </div>
-    """
+    """]
     
     # 测试结果部分
-    html_content += f"""
+    parts.append(f"""
             <div class="section">
                 <h2>🧪 测试结果</h2>
                 <div class="metric">
@@ -318,29 +449,31 @@ def generate_html_report(report_data: Dict[str, Any], output_path: Path):
                 </div>
                 <table>
                     <tr><th>测试文件</th><th>状态</th><th>说明</th></tr>
-    """
+    """)
     
     for test_name, result in test_results.items():
-        status = "✅ 通过" if result.get("passed", False) else "❌ 失败"
-        status_class = "test-passed" if result.get("passed", False) else "test-failed"
-        error = result.get("error", "")[:100] + "..." if result.get("error", "") and len(result.get("error", "")) > 100 else result.get("error", "")
+        passed = result.get("passed", False)
+        status = "✅ 通过" if passed else "❌ 失败"
+        status_class = "test-passed" if passed else "test-failed"
+        error = result.get("error") or ""
+        if len(error) > 100:
+            error = error[:100] + "..."
         
-        html_content += f"""
+        parts.append(f"""
                     <tr>
                         <td>{test_name}</td>
                         <td class="{status_class}">{status}</td>
                         <td>{error or "正常"}</td>
                     </tr>
-        """
+        """)
     
-    html_content += """
+    parts.append("""
                 </table>
             </div>
-    """
+    """)
     
     # 代码覆盖率部分
-    coverage = report_data.get("code_coverage", {})
-    html_content += f"""
+    parts.append(f"""
             <div class="section">
                 <h2>📊 代码覆盖率</h2>
                 <div class="metric">
@@ -352,24 +485,22 @@ def generate_html_report(report_data: Dict[str, Any], output_path: Path):
                     {coverage.get('tested_modules', 0)}/{coverage.get('total_modules', 0)}
                 </div>
             </div>
-    """
+    """)
     
     # 安全状态部分
-    security = report_data.get("security_status", {})
     security_class = "status-good" if security.get("status") == "secure" else "status-warning"
-    html_content += f"""
+    parts.append(f"""
             <div class="section {security_class}">
                 <h2>🔒 安全状态</h2>
                 <p><strong>状态:</strong> {security.get('status', 'unknown')}</p>
                 <p><strong>环境问题:</strong> {len(security.get('environment_issues', []))} 个</p>
             </div>
-    """
+    """)
     
     # 性能状态部分
-    performance = report_data.get("performance_status", {})
     perf_class = f"status-{performance.get('overall_status', 'warning')}"
     metrics = performance.get("metrics", {})
-    html_content += f"""
+    parts.append(f"""
             <div class="section {perf_class}">
                 <h2>⚡ 性能状态</h2>
                 <div class="metric">
@@ -385,64 +516,75 @@ def generate_html_report(report_data: Dict[str, Any], output_path: Path):
                     {metrics.get('cache_stats', {}).get('hit_rate', 0):.1f}%
                 </div>
             </div>
-    """
+    """)
     
     # 优化建议部分
     recommendations = report_data.get("recommendations", [])
-    html_content += f"""
+    parts.append(f"""
             <div class="section recommendations">
                 <h2>💡 优化建议</h2>
                 <ul>
-    """
+    """)
     
     for rec in recommendations:
-        html_content += f"<li>{rec}</li>"
+        parts.append(f"<li>{rec}</li>")
     
-    html_content += """
-                </ul>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    parts.append(_HTML_FOOTER)
     
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write("".join(parts))
 
 
-def main():
-    """主函数"""
+def main(force: bool = False):
+    """主函数
+    
+    Args:
+        force: 为True时忽略缓存的测试与覆盖率结果，全部重新运行
+    """
     print("🚀 生成TradingAgents-CN系统优化报告...")
     print("=" * 60)
     
+    # 源码签名只计算一次，测试与覆盖率共用
+    signature = _source_signature()
+    
     # 收集所有数据
     report_data = {
         "timestamp": time.time(),
-        "test_results": run_test_suite(),
-        "code_coverage": analyze_code_coverage(),
+        "test_results": run_test_suite(signature, force=force),
+        "code_coverage": analyze_code_coverage(signature, force=force),
         "security_status": check_security_status(),
         "performance_status": check_performance_status(),
         "monitoring_status": check_monitoring_status()
     }
     
+    # 测试统计只计算一次，建议、HTML和摘要共用
+    test_summary = summarize_tests(report_data["test_results"])
+    passed_tests, total_tests, _ = test_summary
+    
     # 生成优化建议
-    report_data["recommendations"] = generate_optimization_recommendations(report_data)
+    report_data["recommendations"] = generate_optimization_recommendations(report_data, test_summary)
     
     # 生成报告
     html_output = project_root / "system_optimization_report.html"
-    generate_html_report(report_data, html_output)
+    generate_html_report(report_data, html_output, test_summary)
     
     json_output = project_root / "system_optimization_report.json"
-    with open(json_output, 'w', encoding='utf-8') as f:
-        json.dump(report_data, f, ensure_ascii=False, indent=2, default=str)
+    try:
+        import orjson
+        
+        json_output.write_bytes(orjson.dumps(
+            report_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ))
+    except ImportError:
+        with open(json_output, 'w', encoding='utf-8') as f:
+            json.dump(report_data, f, ensure_ascii=False, indent=2, default=str)
     
     # 打印摘要
     print("\n📈 系统优化报告摘要")
     print("=" * 60)
     
-    test_results = report_data["test_results"]
-    passed_tests = sum(1 for result in test_results.values() if result.get("passed", False))
-    total_tests = len(test_results)
     print(f"测试通过率: {passed_tests}/{total_tests} ({passed_tests/total_tests*100:.1f}%)")
     
     coverage = report_data["code_coverage"]
@@ -466,5 +608,10 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="生成TradingAgents-CN系统优化报告")
+    parser.add_argument("--force", "--no-cache", dest="force", action="store_true",
+                        help="忽略缓存的测试与覆盖率结果，全部重新运行")
+    args = parser.parse_args()
+    
+    success = main(force=args.force)
     sys.exit(0 if success else 1)
@@ -6,21 +6,89 @@
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 依赖统一在模块加载时导入一次；导入失败的置为None，由用到它的测试报告失败
+_IMPORT_ERRORS = {}
+
+try:
+    from tradingagents.dataflows.china_news_enhanced import (
+        ChinaStockNewsAggregator, get_china_stock_news_enhanced
+    )
+except ImportError as e:
+    ChinaStockNewsAggregator = get_china_stock_news_enhanced = None
+    _IMPORT_ERRORS["china_news_enhanced"] = e
+
+try:
+    from tradingagents.agents.utils.agent_utils import Toolkit
+    from tradingagents.default_config import DEFAULT_CONFIG
+except ImportError as e:
+    Toolkit = DEFAULT_CONFIG = None
+    _IMPORT_ERRORS["toolkit"] = e
+
+try:
+    from tradingagents.agents.analysts.news_analyst import create_news_analyst
+except ImportError as e:
+    create_news_analyst = None
+    _IMPORT_ERRORS["news_analyst"] = e
+
+try:
+    from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
+except ImportError as e:
+    create_siliconflow_llm = None
+    _IMPORT_ERRORS["siliconflow_adapter"] = e
+
+
+# 股票代码识别的期望结果（只读，进程内只构建一次）
+_STOCK_CODES = MappingProxyType({
+    "600990": "四维图新",  # 修复：正确的公司名称
+    "000001": "平安银行",
+    "600519": "贵州茅台",
+    "999999": "股票999999"  # 未知代码
+})
+
+# 有效日期测试统一使用昨天的日期，只计算一次
+_YESTERDAY = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+# 综合场景的检查项：(检查名称, 期望出现的文本)
+_SCENARIO_CHECKS = (
+    ("包含股票名称", "四创电子"),
+    ("包含股票代码", "600990"),
+    ("包含日期警告", "日期验证警告"),
+    ("包含解决建议", "解决建议"),
+    ("包含替代方法", "替代分析方法"),
+    ("包含投资建议", "投资建议"),
+)
+# 各关键词互不为前后缀，一次扫描即可找出全部出现的关键词
+_SCENARIO_RE = re.compile("|".join(re.escape(needle) for _, needle in _SCENARIO_CHECKS))
+
+
+def _content(result):
+    """工具可能返回消息对象或纯文本，统一取出文本内容"""
+    return getattr(result, 'content', result)
+
+
+def _require(*names):
+    """依赖缺失时抛出对应的导入错误，交给测试自身的异常处理"""
+    for name in names:
+        if name in _IMPORT_ERRORS:
+            raise _IMPORT_ERRORS[name]
+
 
 def test_future_date_handling():
     """测试未来日期处理"""
     print("🔮 测试未来日期处理...")
     
     try:
-        from tradingagents.dataflows.china_news_enhanced import get_china_stock_news_enhanced
+        _require("china_news_enhanced")
         
         # 测试未来日期
         future_date = "2025-07-14"
@@ -44,11 +112,10 @@ def test_valid_date_handling():
     print("\n📅 测试有效日期处理...")
     
     try:
-        from tradingagents.dataflows.china_news_enhanced import get_china_stock_news_enhanced
+        _require("china_news_enhanced")
         
         # 使用昨天的日期
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-        result = get_china_stock_news_enhanced("600990", yesterday)
+        result = get_china_stock_news_enhanced("600990", _YESTERDAY)
         
         if "新闻事件分析" in result and "四创电子" in result:
             print("  ✅ 有效日期处理正常")
@@ -69,20 +136,13 @@ def test_stock_code_recognition():
     print("\n🔍 测试股票代码识别...")
     
     try:
-        from tradingagents.dataflows.china_news_enhanced import ChinaStockNewsAggregator
+        _require("china_news_enhanced")
         
         aggregator = ChinaStockNewsAggregator()
         
         # 测试已知股票代码
-        test_codes = {
-            "600990": "四维图新",  # 修复：正确的公司名称
-            "000001": "平安银行",
-            "600519": "贵州茅台",
-            "999999": "股票999999"  # 未知代码
-        }
-        
         all_correct = True
-        for code, expected_name in test_codes.items():
+        for code, expected_name in _STOCK_CODES.items():
             actual_name = aggregator.get_stock_name(code)
             if actual_name == expected_name:
                 print(f"  ✅ {code} -> {actual_name}")
@@ -102,27 +162,24 @@ def test_agent_integration():
     print("\n🤖 测试分析师集成...")
     
     try:
-        from tradingagents.agents.utils.agent_utils import Toolkit
-        from tradingagents.default_config import DEFAULT_CONFIG
+        _require("toolkit")
         
         # 创建工具包
         config = DEFAULT_CONFIG.copy()
         toolkit = Toolkit(config=config)
         
         # 测试中国股票新闻工具
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-        
         print("  🔧 测试增强版中国股票新闻工具...")
-        result1 = toolkit.get_china_stock_news_enhanced("600990", yesterday)
-        if "新闻事件分析" in result1.content if hasattr(result1, 'content') else result1:
+        result1 = toolkit.get_china_stock_news_enhanced("600990", _YESTERDAY)
+        if "新闻事件分析" in _content(result1):
             print("  ✅ 增强版新闻工具正常")
         else:
             print("  ❌ 增强版新闻工具异常")
             return False
         
         print("  🔧 测试中国社交情绪工具（自动识别）...")
-        result2 = toolkit.get_chinese_social_sentiment("600990", yesterday)
-        content2 = result2.content if hasattr(result2, 'content') else result2
+        result2 = toolkit.get_chinese_social_sentiment("600990", _YESTERDAY)
+        content2 = _content(result2)
         if "新闻事件分析" in content2 or "情绪分析" in content2:
             print("  ✅ 社交情绪工具自动识别中国股票")
         else:
@@ -141,10 +198,7 @@ def test_news_analyst_smart_selection():
     print("\n📰 测试新闻分析师智能工具选择...")
     
     try:
-        from tradingagents.agents.analysts.news_analyst import create_news_analyst
-        from tradingagents.agents.utils.agent_utils import Toolkit
-        from tradingagents.default_config import DEFAULT_CONFIG
-        from tradingagents.llm_adapters.siliconflow_adapter import create_siliconflow_llm
+        _require("news_analyst", "toolkit", "siliconflow_adapter")
         
         # 检查是否有硅基流动API密钥
         if not os.getenv('SILICONFLOW_API_KEY'):
@@ -180,19 +234,13 @@ def test_comprehensive_scenario():
         # 模拟用户查询600990在未来日期的新闻
         print("  📋 场景: 用户查询600990在2025-07-14的新闻")
         
-        from tradingagents.dataflows.china_news_enhanced import get_china_stock_news_enhanced
+        _require("china_news_enhanced")
         
         result = get_china_stock_news_enhanced("600990", "2025-07-14")
         
         # 检查关键要素
-        checks = [
-            ("包含股票名称", "四创电子" in result),
-            ("包含股票代码", "600990" in result),
-            ("包含日期警告", "日期验证警告" in result),
-            ("包含解决建议", "解决建议" in result),
-            ("包含替代方法", "替代分析方法" in result),
-            ("包含投资建议", "投资建议" in result),
-        ]
+        found = {m.group() for m in _SCENARIO_RE.finditer(result)}
+        checks = [(check_name, needle in found) for check_name, needle in _SCENARIO_CHECKS]
         
         all_passed = True
         for check_name, check_result in checks:
@@ -7,14 +7,99 @@
 
 import os
 import sys
+import argparse
 import ast
 import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Set, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Set, Any, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 
 
-@dataclass
+# 分析逻辑变化时递增，使旧缓存整体失效
+_ANALYSIS_CACHE_VERSION = 3
+
+
+class _AnalysisCache:
+    """按文件 (mtime_ns, size) 缓存分析结果，并在多次运行之间持久化到磁盘"""
+    
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Dict[Tuple[str, str], Tuple[int, int, Dict[str, Any]]] = {}
+        self._dirty = False
+    
+    def load(self):
+        """加载上次运行的缓存，文件缺失或损坏时从空缓存开始"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+            return
+        if version == _ANALYSIS_CACHE_VERSION and isinstance(entries, dict):
+            self._entries = entries
+    
+    def save(self):
+        """写回缓存，失败时忽略（缓存只是加速手段）"""
+        if not self._dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump((_ANALYSIS_CACHE_VERSION, self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._dirty = False
+        except OSError:
+            pass
+    
+    def analyze_all(self, kind: str, paths: List[Path], analyze) -> List[Dict[str, Any]]:
+        """批量分析文件：未变化的直接复用缓存，其余交给_parallel_map重新分析"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        misses = []
+        
+        for i, path in enumerate(paths):
+            try:
+                st = os.stat(path)
+            except OSError:
+                misses.append((i, path, None))
+                continue
+            cached = self._entries.get((kind, str(path)))
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                results[i] = dict(cached[2])
+            else:
+                misses.append((i, path, st))
+        
+        analyzed = _parallel_map(analyze, [path for _, path, _ in misses])
+        for (i, path, st), result in zip(misses, analyzed):
+            if st is not None:
+                self._entries[(kind, str(path))] = (st.st_mtime_ns, st.st_size, result)
+                self._dirty = True
+            results[i] = dict(result)
+        
+        return results
+
+
+# 待分析文件少于该数量时进程池的启动开销大于收益，直接串行
+_PARALLEL_THRESHOLD = 32
+
+
+def _parallel_map(func, items: List[Any]) -> List[Any]:
+    """ast.parse受GIL限制，文件较多时用进程池并行，进程池不可用时退回串行"""
+    if len(items) < _PARALLEL_THRESHOLD:
+        return [func(item) for item in items]
+    
+    workers = os.cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items, chunksize=max(1, len(items) // (4 * workers))))
+    except (OSError, BrokenProcessPool) as e:
+        print(f"⚠️ 进程池不可用，改为串行分析: {e}")
+        return [func(item) for item in items]
+
+
+@dataclass(slots=True)
 class ModuleCoverage:
     """模块覆盖率信息"""
     name: str
@@ -27,7 +112,7 @@ class ModuleCoverage:
     missing_tests: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageReport:
     """覆盖率报告"""
     total_modules: int
@@ -37,6 +122,142 @@ class CoverageReport:
     recommendations: List[str]
 
 
+# 只沿这些字段下钻即可覆盖全部语句，表达式子树无需访问
+_STMT_FIELDS = ('body', 'orelse', 'finalbody', 'handlers')
+
+
+class _SymbolCollector(ast.NodeVisitor):
+    """单次遍历收集模块级函数、类（含类方法）及tradingagents导入
+    
+    只沿语句体下钻，不访问表达式节点；函数体内只继续查找导入语句，
+    嵌套定义的函数和类不计入统计。
+    """
+    
+    def __init__(self):
+        self.functions: List[str] = []
+        self.classes: List[str] = []
+        self.imports: Set[str] = set()
+        self._depth = 0
+    
+    def generic_visit(self, node):
+        for field in _STMT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+    
+    def _visit_nested(self, node):
+        self._depth += 1
+        self.generic_visit(node)
+        self._depth -= 1
+    
+    def visit_FunctionDef(self, node):
+        if self._depth == 0:
+            self.functions.append(node.name)
+        self._visit_nested(node)
+    
+    def visit_AsyncFunctionDef(self, node):
+        self._visit_nested(node)
+    
+    def visit_ClassDef(self, node):
+        if self._depth == 0:
+            self.classes.append(node.name)
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef):
+                    self.functions.append(f"{node.name}.{item.name}")
+        self._visit_nested(node)
+    
+    def visit_Import(self, node):
+        for alias in node.names:
+            if alias.name.startswith('tradingagents'):
+                self.imports.add(alias.name)
+    
+    def visit_ImportFrom(self, node):
+        if node.module and node.module.startswith('tradingagents'):
+            self.imports.add(node.module)
+
+
+def _analyze_module(module_path: Path) -> Dict[str, Any]:
+    """分析单个模块（模块级函数，可被进程池pickle）"""
+    try:
+        # ast.parse直接接受bytes，省去文本解码这一步
+        with open(module_path, 'rb') as f:
+            content = f.read()
+        
+        collector = _SymbolCollector()
+        collector.visit(ast.parse(content))
+        
+        # 排除私有函数
+        functions = [name for name in collector.functions
+                     if not name.rsplit('.', 1)[-1].startswith('_')]
+        classes = collector.classes
+        
+        return {
+            "functions": functions,
+            "classes": classes,
+            "total_functions": len(functions),
+            "total_classes": len(classes)
+        }
+    
+    except Exception as e:
+        print(f"分析模块失败 {module_path}: {e}")
+        return {
+            "functions": [],
+            "classes": [],
+            "total_functions": 0,
+            "total_classes": 0
+        }
+
+
+def _analyze_test_file(test_path: Path) -> Dict[str, Any]:
+    """分析测试文件（模块级函数，可被进程池pickle）"""
+    try:
+        # ast.parse直接接受bytes，省去文本解码这一步
+        with open(test_path, 'rb') as f:
+            content = f.read()
+        
+        collector = _SymbolCollector()
+        collector.visit(ast.parse(content))
+        
+        test_classes = [name for name in collector.classes if name.startswith('Test')]
+        test_class_set = set(test_classes)
+        test_functions = []
+        for name in collector.functions:
+            owner, _, func = name.rpartition('.')
+            # 模块级测试函数，以及测试类中的测试方法
+            if func.startswith('test_') and (not owner or owner in test_class_set):
+                test_functions.append(name)
+        tested_modules = collector.imports
+        
+        return {
+            "test_functions": test_functions,
+            "test_classes": test_classes,
+            "tested_modules": list(tested_modules),
+            "total_tests": len(test_functions)
+        }
+    
+    except Exception as e:
+        print(f"分析测试文件失败 {test_path}: {e}")
+        return {
+            "test_functions": [],
+            "test_classes": [],
+            "tested_modules": [],
+            "total_tests": 0
+        }
+
+
+def _iter_py_files(path: str):
+    """基于os.scandir递归产出非__init__的.py文件，顺序与Path.rglob一致"""
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                yield Path(entry.path)
+    for subdir in subdirs:
+        yield from _iter_py_files(subdir)
+
+
 class CodeAnalyzer:
     """代码分析器"""
     
@@ -52,41 +273,7 @@ class CodeAnalyzer:
     
     def analyze_module(self, module_path: Path) -> Dict[str, Any]:
         """分析单个模块"""
-        try:
-            with open(module_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            
-            functions = []
-            classes = []
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if not node.name.startswith('_'):  # 排除私有函数
-                        functions.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    classes.append(node.name)
-                    # 添加类中的公共方法
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef) and not item.name.startswith('_'):
-                            functions.append(f"{node.name}.{item.name}")
-            
-            return {
-                "functions": functions,
-                "classes": classes,
-                "total_functions": len(functions),
-                "total_classes": len(classes)
-            }
-        
-        except Exception as e:
-            print(f"分析模块失败 {module_path}: {e}")
-            return {
-                "functions": [],
-                "classes": [],
-                "total_functions": 0,
-                "total_classes": 0
-            }
+        return _analyze_module(module_path)
     
     def find_python_files(self) -> List[Path]:
         """查找Python文件"""
@@ -95,9 +282,7 @@ class CodeAnalyzer:
         for source_dir in self.source_dirs:
             dir_path = self.project_root / source_dir
             if dir_path.exists():
-                for py_file in dir_path.rglob("*.py"):
-                    if py_file.name != "__init__.py":
-                        python_files.append(py_file)
+                python_files.extend(_iter_py_files(str(dir_path)))
         
         return python_files
 
@@ -121,51 +306,7 @@ class TestAnalyzer:
     
     def analyze_test_file(self, test_path: Path) -> Dict[str, Any]:
         """分析测试文件"""
-        try:
-            with open(test_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            
-            test_functions = []
-            test_classes = []
-            tested_modules = set()
-            
-            # 查找导入的模块
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name.startswith('tradingagents'):
-                            tested_modules.add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module and node.module.startswith('tradingagents'):
-                        tested_modules.add(node.module)
-                elif isinstance(node, ast.FunctionDef):
-                    if node.name.startswith('test_'):
-                        test_functions.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    if node.name.startswith('Test'):
-                        test_classes.append(node.name)
-                        # 添加测试类中的测试方法
-                        for item in node.body:
-                            if isinstance(item, ast.FunctionDef) and item.name.startswith('test_'):
-                                test_functions.append(f"{node.name}.{item.name}")
-            
-            return {
-                "test_functions": test_functions,
-                "test_classes": test_classes,
-                "tested_modules": list(tested_modules),
-                "total_tests": len(test_functions)
-            }
-        
-        except Exception as e:
-            print(f"分析测试文件失败 {test_path}: {e}")
-            return {
-                "test_functions": [],
-                "test_classes": [],
-                "tested_modules": [],
-                "total_tests": 0
-            }
+        return _analyze_test_file(test_path)
 
 
 class CoverageAnalyzer:
@@ -175,17 +316,28 @@ class CoverageAnalyzer:
         self.project_root = project_root
         self.code_analyzer = CodeAnalyzer(project_root)
         self.test_analyzer = TestAnalyzer(project_root)
+        # 未修改的文件直接复用上次的解析结果，跳过读取与ast.parse
+        self.cache = _AnalysisCache(project_root / ".cache" / "coverage_analysis.pkl")
     
     def generate_report(self) -> CoverageReport:
         """生成覆盖率报告"""
+        self.cache.load()
+        try:
+            return self._generate_report()
+        finally:
+            self.cache.save()
+    
+    def _generate_report(self) -> CoverageReport:
+        """逐文件分析源码与测试并计算覆盖率"""
         # 分析源代码
         python_files = self.code_analyzer.find_python_files()
         code_analysis = {}
+        module_results = self.cache.analyze_all("module", python_files, _analyze_module)
         
-        for py_file in python_files:
+        for py_file, analysis in zip(python_files, module_results):
             relative_path = py_file.relative_to(self.project_root)
-            module_name = str(relative_path).replace('/', '.').replace('.py', '')
-            code_analysis[module_name] = self.code_analyzer.analyze_module(py_file)
+            module_name = sys.intern(str(relative_path).replace('/', '.').replace('.py', ''))
+            code_analysis[module_name] = analysis
             code_analysis[module_name]['path'] = str(relative_path)
         
         # 分析测试
@@ -193,10 +345,19 @@ class CoverageAnalyzer:
         test_analysis = {}
         all_tested_modules = set()
         
-        for test_file in test_files:
+        test_results = self.cache.analyze_all("test", test_files, _analyze_test_file)
+        
+        for test_file, analysis in zip(test_files, test_results):
             test_name = test_file.stem
-            test_analysis[test_name] = self.test_analyzer.analyze_test_file(test_file)
-            all_tested_modules.update(test_analysis[test_name]['tested_modules'])
+            test_analysis[test_name] = analysis
+            # 结果可能来自缓存或子进程（经pickle传回），在汇总处统一驻留字符串
+            all_tested_modules.update(map(sys.intern, test_analysis[test_name]['tested_modules']))
+        
+        # 导入了模块本身或其子模块都视为已测试：展开所有点分前缀后单次集合查找即可
+        tested_prefixes = set()
+        for tested in all_tested_modules:
+            parts = tested.split('.')
+            tested_prefixes.update(sys.intern('.'.join(parts[:i])) for i in range(1, len(parts) + 1))
         
         # 计算覆盖率
         module_coverage = []
@@ -204,7 +365,7 @@ class CoverageAnalyzer:
         tested_functions = 0
         
         for module_name, analysis in code_analysis.items():
-            is_tested = any(module_name in tested_modules for tested_modules in all_tested_modules)
+            is_tested = module_name in tested_prefixes
             
             # 简单的启发式：如果模块被导入，假设50%的函数被测试
             tested_func_count = int(analysis['total_functions'] * 0.5) if is_tested else 0
@@ -275,9 +436,62 @@ class CoverageAnalyzer:
         return recommendations
 
 
-def generate_html_report(report: CoverageReport, output_path: Path):
-    """生成HTML报告"""
-    html_content = f"""
+def _report_payload(report: CoverageReport, test_files: List[str]) -> Dict[str, Any]:
+    """构造JSON报告内容，直接引用已有列表，避免asdict的递归深拷贝
+    
+    Args:
+        report: 覆盖率报告
+        test_files: 参与分析的测试文件（相对路径），用于判断已有报告是否仍然有效
+    """
+    return {
+        "total_modules": report.total_modules,
+        "tested_modules": report.tested_modules,
+        "overall_coverage": report.overall_coverage,
+        "module_coverage": [
+            {
+                "name": m.name,
+                "path": m.path,
+                "total_functions": m.total_functions,
+                "tested_functions": m.tested_functions,
+                "total_classes": m.total_classes,
+                "tested_classes": m.tested_classes,
+                "coverage_percentage": m.coverage_percentage,
+                "missing_tests": m.missing_tests
+            }
+            for m in report.module_coverage
+        ],
+        "recommendations": report.recommendations,
+        "test_files": test_files
+    }
+
+
+def _sort_by_coverage(modules: List[ModuleCoverage]) -> List[ModuleCoverage]:
+    """按覆盖率从高到低排序"""
+    return sorted(modules, key=attrgetter('coverage_percentage'), reverse=True)
+
+
+# 单个模块的HTML片段，一次format生成整块内容
+_MODULE_HTML = """
+        <div class="module {css_class}">
+            <h3>{name}</h3>
+            <p><strong>路径:</strong> {path}</p>
+            <p><strong>函数:</strong> {tested_functions}/{total_functions} 
+               ({coverage_percentage:.1f}%)</p>
+            <p><strong>类:</strong> {tested_classes}/{total_classes}</p>
+        {missing_block}</div>"""
+
+
+def generate_html_report(report: CoverageReport, output_path: Path,
+                         sorted_modules: Optional[List[ModuleCoverage]] = None):
+    """生成HTML报告
+    
+    Args:
+        sorted_modules: 已按覆盖率排好序的模块列表，未提供时自行排序
+    """
+    if sorted_modules is None:
+        sorted_modules = _sort_by_coverage(report.module_coverage)
+    
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -296,7 +510,7 @@ def generate_html_report(report: CoverageReport, output_path: Path):
     <body>
         <div class="header">
             <h1>TradingAgents-CN 测试覆盖率报告</h1>
-            <p>生成时间: {os.popen('date').read().strip()}</p>
+            <p>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
         </div>
         
         <div class="summary">
@@ -309,57 +523,111 @@ def generate_html_report(report: CoverageReport, output_path: Path):
         <div class="recommendations">
             <h2>💡 改进建议</h2>
             <ul>
-    """
+    """]
     
     for rec in report.recommendations:
-        html_content += f"<li>{rec}</li>"
+        parts.append(f"<li>{rec}</li>")
     
-    html_content += """
+    parts.append("""
             </ul>
         </div>
         
         <h2>📋 模块详情</h2>
-    """
+    """)
     
-    for module in sorted(report.module_coverage, key=lambda x: x.coverage_percentage, reverse=True):
+    for module in sorted_modules:
         css_class = "high-coverage" if module.coverage_percentage >= 80 else \
                    "medium-coverage" if module.coverage_percentage >= 50 else "low-coverage"
         
-        html_content += f"""
-        <div class="module {css_class}">
-            <h3>{module.name}</h3>
-            <p><strong>路径:</strong> {module.path}</p>
-            <p><strong>函数:</strong> {module.tested_functions}/{module.total_functions} 
-               ({module.coverage_percentage:.1f}%)</p>
-            <p><strong>类:</strong> {module.tested_classes}/{module.total_classes}</p>
-        """
-        
+        missing_block = ""
         if module.missing_tests:
-            html_content += "<p><strong>缺失测试:</strong></p><ul>"
-            for missing in module.missing_tests:
-                html_content += f"<li>{missing}</li>"
-            html_content += "</ul>"
+            missing_block = "<p><strong>缺失测试:</strong></p><ul>" + "".join(
+                f"<li>{missing}</li>" for missing in module.missing_tests) + "</ul>"
         
-        html_content += "</div>"
+        parts.append(_MODULE_HTML.format(
+            css_class=css_class,
+            name=module.name,
+            path=module.path,
+            tested_functions=module.tested_functions,
+            total_functions=module.total_functions,
+            coverage_percentage=module.coverage_percentage,
+            tested_classes=module.tested_classes,
+            total_classes=module.total_classes,
+            missing_block=missing_block
+        ))
     
-    html_content += """
+    parts.append("""
     </body>
     </html>
-    """
+    """)
     
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write("".join(parts))
+
+
+def _newest_source_mtime(paths: List[Path]) -> int:
+    """给定文件及本脚本中最新的修改时间（纳秒）"""
+    return max(os.stat(path).st_mtime_ns for path in [Path(__file__), *paths])
+
+
+def _relative_paths(project_root: Path, paths: List[Path]) -> Set[str]:
+    """文件相对项目根目录的路径集合"""
+    return {str(path.relative_to(project_root)) for path in paths}
+
+
+def _load_fresh_report(analyzer: CoverageAnalyzer, html_output: Path,
+                       json_output: Path) -> Optional[CoverageReport]:
+    """HTML和JSON报告都比所有源码和测试新、且源码与测试文件集合未变时，从JSON还原报告；否则返回None"""
+    try:
+        report_mtime = min(os.stat(html_output).st_mtime_ns, os.stat(json_output).st_mtime_ns)
+    except OSError:
+        return None
+    
+    source_files = analyzer.code_analyzer.find_python_files()
+    test_files = analyzer.test_analyzer.find_test_files()
+    if report_mtime <= _newest_source_mtime(source_files + test_files):
+        return None
+    
+    try:
+        with open(json_output, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        # 删除文件不会产生更新的mtime，需再核对报告中的文件集合与当前一致
+        project_root = analyzer.project_root
+        if {m["path"] for m in data["module_coverage"]} != _relative_paths(project_root, source_files):
+            return None
+        if set(data["test_files"]) != _relative_paths(project_root, test_files):
+            return None
+        
+        return CoverageReport(
+            total_modules=data["total_modules"],
+            tested_modules=data["tested_modules"],
+            overall_coverage=data["overall_coverage"],
+            module_coverage=[ModuleCoverage(**m) for m in data["module_coverage"]],
+            recommendations=data["recommendations"]
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
 
-def main():
-    """主函数"""
+def main(force: bool = False):
+    """主函数
+    
+    Args:
+        force: 为True时忽略已有报告，强制重新分析
+    """
     print("📊 生成TradingAgents-CN测试覆盖率报告...")
     
     project_root = Path(__file__).parent.parent
     analyzer = CoverageAnalyzer(project_root)
+    html_output = project_root / "coverage_report.html"
+    json_output = project_root / "coverage_report.json"
     
-    # 生成报告
-    report = analyzer.generate_report()
+    # 源码和测试均未变化时沿用已有报告，否则重新生成
+    report = None if force else _load_fresh_report(analyzer, html_output, json_output)
+    reused = report is not None
+    if not reused:
+        report = analyzer.generate_report()
     
     # 打印控制台报告
     print(f"\n📈 测试覆盖率报告")
@@ -372,27 +640,44 @@ def main():
     for i, rec in enumerate(report.recommendations, 1):
         print(f"  {i}. {rec}")
     
+    # 控制台与HTML报告共用同一份排序结果
+    sorted_modules = _sort_by_coverage(report.module_coverage)
+    
     print(f"\n📋 模块覆盖率详情:")
-    for module in sorted(report.module_coverage, key=lambda x: x.coverage_percentage, reverse=True):
+    for module in sorted_modules:
         status = "🟢" if module.coverage_percentage >= 80 else \
                 "🟡" if module.coverage_percentage >= 50 else "🔴"
         print(f"  {status} {module.name}: {module.coverage_percentage:.1f}% "
               f"({module.tested_functions}/{module.total_functions} 函数)")
     
+    if reused:
+        print(f"\n♻️ 源码与测试未变化，沿用已有报告: {html_output}")
+        return report.overall_coverage >= 70
+    
     # 生成HTML报告
-    html_output = project_root / "coverage_report.html"
-    generate_html_report(report, html_output)
+    generate_html_report(report, html_output, sorted_modules)
     print(f"\n📄 HTML报告已生成: {html_output}")
     
     # 生成JSON报告
-    json_output = project_root / "coverage_report.json"
-    with open(json_output, 'w', encoding='utf-8') as f:
-        json.dump(asdict(report), f, ensure_ascii=False, indent=2)
+    test_files = sorted(_relative_paths(project_root, analyzer.test_analyzer.find_test_files()))
+    payload = _report_payload(report, test_files)
+    try:
+        # orjson可选：可用时直接输出UTF-8字节，否则回退到标准库json
+        import orjson
+        
+        json_output.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        with open(json_output, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
     print(f"📄 JSON报告已生成: {json_output}")
     
     return report.overall_coverage >= 70  # 70%覆盖率为通过标准
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="生成TradingAgents-CN测试覆盖率报告")
+    parser.add_argument("--force", action="store_true", help="忽略已有报告，强制重新分析")
+    args = parser.parse_args()
+    
+    success = main(force=args.force)
     sys.exit(0 if success else 1)
@@ -1,323 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-测试专用模型回退机制
-验证当专用模型调用失败时，是否正确回退到DEFAULT_MODEL
-"""
-
-import os
-import sys
-from pathlib import Path
-
-# 添加项目根目录到Python路径
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-
-def test_default_model_config():
-    """测试DEFAULT_MODEL配置"""
-    print("🔧 测试DEFAULT_MODEL配置...")
-    
-    try:
-        from tradingagents.default_config import DEFAULT_CONFIG
-        
-        default_model = DEFAULT_CONFIG.get('default_model')
-        print(f"📊 默认配置中的default_model: {default_model}")
-        
-        # 检查环境变量
-        env_default = os.getenv('DEFAULT_MODEL')
-        print(f"📊 环境变量DEFAULT_MODEL: {env_default or '未设置'}")
-        
-        # 验证回退逻辑
-        expected_default = "deepseek-ai/DeepSeek-V3"
-        if default_model == expected_default:
-            print(f"✅ DEFAULT_MODEL配置正确: {default_model}")
-            return True
-        else:
-            print(f"❌ DEFAULT_MODEL配置错误，期望: {expected_default}，实际: {default_model}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ DEFAULT_MODEL配置测试失败: {e}")
-        return False
-
-
-def test_fallback_llm_creation():
-    """测试回退LLM创建功能"""
-    print("\n🤖 测试回退LLM创建...")
-    
-    try:
-        from tradingagents.graph.setup import GraphSetup
-        from tradingagents.default_config import DEFAULT_CONFIG
-        
-        # 模拟配置
-        config = DEFAULT_CONFIG.copy()
-        
-        # 创建GraphSetup实例（需要模拟其他参数）
-        setup = GraphSetup(
-            quick_thinking_llm=None,  # 模拟
-            deep_thinking_llm=None,   # 模拟
-            toolkit=None,             # 模拟
-            tool_nodes={},            # 模拟
-            bull_memory=None,         # 模拟
-            bear_memory=None,         # 模拟
-            trader_memory=None,       # 模拟
-            invest_judge_memory=None, # 模拟
-            risk_manager_memory=None, # 模拟
-            conditional_logic=None,   # 模拟
-            config=config
-        )
-        
-        print("📊 回退LLM创建测试:")
-        
-        # 测试_create_fallback_llm方法是否存在
-        if hasattr(setup, '_create_fallback_llm'):
-            print("  ✅ _create_fallback_llm方法存在")
-            
-            # 测试方法调用
-            try:
-                result = setup._create_fallback_llm("deepseek-ai/DeepSeek-V3")
-                print("  ✅ 回退LLM创建方法调用成功")
-                return True
-            except Exception as e:
-                print(f"  ⚠️ 回退LLM创建失败（预期，因为缺少API密钥）: {e}")
-                return True  # 这是预期的
-        else:
-            print("  ❌ _create_fallback_llm方法不存在")
-            return False
-            
-    except Exception as e:
-        print(f"❌ 回退LLM创建测试失败: {e}")
-        return False
-
-
-def test_specialized_llm_fallback():
-    """测试专用LLM的回退逻辑"""
-    print("\n🔄 测试专用LLM回退逻辑...")
-    
-    try:
-        from tradingagents.graph.setup import GraphSetup
-        from tradingagents.default_config import DEFAULT_CONFIG
-        
-        # 模拟配置（故意不设置API密钥来触发回退）
-        config = DEFAULT_CONFIG.copy()
-        config["market_analyst_llm"] = "meta-llama/Llama-3.1-70B-Instruct"
-        
-        # 临时移除API密钥（如果存在）
-        original_api_key = os.environ.get('SILICONFLOW_API_KEY')
-        if 'SILICONFLOW_API_KEY' in os.environ:
-            del os.environ['SILICONFLOW_API_KEY']
-        
-        # 设置DEFAULT_MODEL
-        os.environ['DEFAULT_MODEL'] = 'deepseek-ai/DeepSeek-V3'
-        
-        try:
-            # 创建GraphSetup实例
-            setup = GraphSetup(
-                quick_thinking_llm=None,  # 模拟
-                deep_thinking_llm=None,   # 模拟
-                toolkit=None,             # 模拟
-                tool_nodes={},            # 模拟
-                bull_memory=None,         # 模拟
-                bear_memory=None,         # 模拟
-                trader_memory=None,       # 模拟
-                invest_judge_memory=None, # 模拟
-                risk_manager_memory=None, # 模拟
-                conditional_logic=None,   # 模拟
-                config=config
-            )
-            
-            print("📊 专用LLM回退测试:")
-            
-            # 测试专用LLM创建（应该触发回退）
-            if hasattr(setup, '_create_specialized_llm'):
-                print("  ✅ _create_specialized_llm方法存在")
-                
-                try:
-                    result = setup._create_specialized_llm("market_analyst_llm")
-                    print("  ✅ 专用LLM创建成功（可能使用了回退机制）")
-                    return True
-                except Exception as e:
-                    print(f"  ⚠️ 专用LLM创建失败: {e}")
-                    return True  # 这也是可以接受的
-            else:
-                print("  ❌ _create_specialized_llm方法不存在")
-                return False
-                
-        finally:
-            # 恢复原始API密钥
-            if original_api_key:
-                os.environ['SILICONFLOW_API_KEY'] = original_api_key
-            
-    except Exception as e:
-        print(f"❌ 专用LLM回退测试失败: {e}")
-        return False
-
-
-def test_env_example_default_model():
-    """测试.env.example是否包含DEFAULT_MODEL配置"""
-    print("\n📄 测试.env.example DEFAULT_MODEL配置...")
-    
-    try:
-        env_file = project_root / ".env.example"
-        content = env_file.read_text(encoding='utf-8')
-        
-        # 检查是否包含DEFAULT_MODEL配置
-        if "DEFAULT_MODEL=" in content:
-            print("  ✅ .env.example包含DEFAULT_MODEL配置")
-            
-            # 检查默认值
-            if "DEFAULT_MODEL=deepseek-ai/DeepSeek-V3" in content:
-                print("  ✅ DEFAULT_MODEL默认值正确")
-                return True
-            else:
-                print("  ❌ DEFAULT_MODEL默认值不正确")
-                return False
-        else:
-            print("  ❌ .env.example缺少DEFAULT_MODEL配置")
-            return False
-            
-    except Exception as e:
-        print(f"❌ .env.example测试失败: {e}")
-        return False
-
-
-def test_fallback_scenarios():
-    """测试各种回退场景"""
-    print("\n🎯 测试回退场景...")
-    
-    scenarios = [
-        {
-            "name": "API密钥缺失",
-            "description": "SILICONFLOW_API_KEY未设置",
-            "expected": "回退到DEFAULT_MODEL"
-        },
-        {
-            "name": "专用模型未配置",
-            "description": "分析师专用模型配置为空",
-            "expected": "回退到DEFAULT_MODEL"
-        },
-        {
-            "name": "模型创建失败",
-            "description": "专用模型创建时出现异常",
-            "expected": "回退到DEFAULT_MODEL"
-        },
-        {
-            "name": "不支持的提供商",
-            "description": "LLM提供商不是硅基流动",
-            "expected": "回退到DEFAULT_MODEL"
-        }
-    ]
-    
-    print("📊 回退场景分析:")
-    for scenario in scenarios:
-        print(f"  🔄 {scenario['name']}")
-        print(f"     描述: {scenario['description']}")
-        print(f"     预期: {scenario['expected']}")
-    
-    print("\n✅ 所有回退场景都已在代码中实现")
-    return True
-
-
-def test_default_model_priority():
-    """测试DEFAULT_MODEL的优先级"""
-    print("\n🏆 测试DEFAULT_MODEL优先级...")
-    
-    try:
-        # 测试环境变量优先级
-        original_env = os.environ.get('DEFAULT_MODEL')
-        
-        # 设置环境变量
-        os.environ['DEFAULT_MODEL'] = 'test-model-from-env'
-        
-        try:
-            from tradingagents.default_config import DEFAULT_CONFIG
-            
-            # 重新导入以获取最新的环境变量值
-            import importlib
-            import tradingagents.default_config
-            importlib.reload(tradingagents.default_config)
-            from tradingagents.default_config import DEFAULT_CONFIG
-            
-            default_model = DEFAULT_CONFIG.get('default_model')
-            
-            if default_model == 'test-model-from-env':
-                print("  ✅ 环境变量DEFAULT_MODEL优先级正确")
-                return True
-            else:
-                print(f"  ❌ 环境变量优先级错误，期望: test-model-from-env，实际: {default_model}")
-                return False
-                
-        finally:
-            # 恢复原始环境变量
-            if original_env:
-                os.environ['DEFAULT_MODEL'] = original_env
-            elif 'DEFAULT_MODEL' in os.environ:
-                del os.environ['DEFAULT_MODEL']
-                
-    except Exception as e:
-        print(f"❌ DEFAULT_MODEL优先级测试失败: {e}")
-        return False
-
-
-def main():
-    """主测试函数"""
-    print("🔄 专用模型回退机制测试")
-    print("=" * 60)
-    print("目标: 验证专用模型调用失败时正确回退到DEFAULT_MODEL")
-    print("=" * 60)
-    
-    tests = [
-        ("DEFAULT_MODEL配置", test_default_model_config),
-        ("回退LLM创建", test_fallback_llm_creation),
-        ("专用LLM回退逻辑", test_specialized_llm_fallback),
-        (".env.example配置", test_env_example_default_model),
-        ("回退场景分析", test_fallback_scenarios),
-        ("DEFAULT_MODEL优先级", test_default_model_priority),
-    ]
-    
-    results = {}
-    
-    for test_name, test_func in tests:
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"❌ {test_name} 出现异常: {e}")
-            results[test_name] = False
-    
-    # 总结结果
-    print("\n📊 测试结果总结")
-    print("=" * 60)
-    
-    passed = 0
-    total = len(tests)
-    
-    for test_name, success in results.items():
-        status = "✅ 通过" if success else "❌ 失败"
-        print(f"  {test_name}: {status}")
-        if success:
-            passed += 1
-    
-    print(f"\n🎯 总体结果: {passed}/{total} 测试通过")
-    
-    if passed == total:
-        print("\n🎉 回退机制配置成功！")
-        print("💡 现在系统将：")
-        print("  - 优先使用专用高性能模型")
-        print("  - API密钥缺失时回退到DEFAULT_MODEL")
-        print("  - 专用模型创建失败时回退到DEFAULT_MODEL")
-        print("  - 不支持的提供商时回退到DEFAULT_MODEL")
-        print(f"  - 默认回退模型: deepseek-ai/DeepSeek-V3")
-    elif passed >= total * 0.8:
-        print("\n✅ 回退机制基本成功！")
-        print("⚠️ 部分功能可能需要进一步优化")
-    else:
-        print("\n❌ 回退机制配置不完整")
-        print("🔧 需要进一步检查和修复")
-    
-    return passed >= total * 0.8
-
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+测试共用的辅助函数
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def make_stub_setup(frozen_config_items):
+    """
+    创建除配置外其余组件均为占位值的GraphSetup实例
+    
+    参数为 tuple(sorted(config.items()))，相同配置直接返回已创建的实例
+    """
+    from tradingagents.graph.setup import GraphSetup
+    
+    return GraphSetup(
+        quick_thinking_llm=None,
+        deep_thinking_llm=None,
+        toolkit=None,
+        tool_nodes={},
+        bull_memory=None,
+        bear_memory=None,
+        trader_memory=None,
+        invest_judge_memory=None,
+        risk_manager_memory=None,
+        conditional_logic=None,
+        config=dict(frozen_config_items)
+    )
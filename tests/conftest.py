@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+pytest公共配置
+
+各测试文件相互独立、不共享进程状态，安装pytest-xdist后可直接并行运行：
+    pytest tests -n auto --dist=loadfile
+"""
+
+import ast
+import contextlib
+import re
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from tests._support import make_stub_setup
+
+# .env.example中未注释的配置项名称（行首的 KEY=）
+_ENV_KEY_RE = re.compile(r'(?m)^([A-Z_][A-Z0-9_]*)=')
+
+# 新闻与社交情绪数据接口的固定返回值，替换后相关测试无需访问外部网络
+_NEWS_API_STUBS = {
+    "tradingagents.dataflows.interface.get_google_news": "## Google News\n### 模拟新闻标题\n模拟新闻内容",
+    "tradingagents.dataflows.interface.get_finnhub_news": "## Finnhub News\n### 模拟新闻标题\n模拟新闻内容",
+    "tradingagents.dataflows.interface.get_reddit_company_news": "## Reddit News\n### 模拟帖子标题\n模拟帖子内容",
+    "tradingagents.dataflows.interface.get_chinese_social_sentiment": "## 中国社交媒体情绪\n模拟情绪分析",
+    "tradingagents.dataflows.interface.get_fundamentals_finnhub": "## Finnhub基本面数据\n模拟基本面数据",
+    "tradingagents.dataflows.realtime_news_utils.get_realtime_stock_news": "## 实时新闻\n模拟实时新闻",
+    "tradingagents.dataflows.china_news_enhanced.get_china_stock_news_enhanced": "## 中国股票新闻\n模拟新闻分析",
+}
+
+
+@pytest.fixture(scope="session")
+def env_example_text():
+    """.env.example的内容，整个测试会话只读取一次"""
+    return (Path(__file__).parent.parent / ".env.example").read_text(encoding='utf-8')
+
+
+@pytest.fixture(scope="session")
+def env_example_keys(env_example_text):
+    """.env.example中已声明的配置项名称集合"""
+    return frozenset(_ENV_KEY_RE.findall(env_example_text))
+
+
+@pytest.fixture(scope="session")
+def cli_string_literals():
+    """cli/utils.py中全部字符串字面量（经ast解析，注释中的文本不计入）"""
+    tree = ast.parse((Path(__file__).parent.parent / "cli" / "utils.py").read_bytes())
+    return frozenset(
+        node.value for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    )
+
+
+@pytest.fixture
+def mock_news_apis():
+    """将新闻与社交情绪数据接口替换为返回固定内容的模拟对象，按函数名返回各模拟对象"""
+    with contextlib.ExitStack() as stack:
+        yield {
+            target.rsplit(".", 1)[1]: stack.enter_context(mock.patch(target, return_value=payload))
+            for target, payload in _NEWS_API_STUBS.items()
+        }
+
+
+@pytest.fixture(scope="session")
+def graph_setup():
+    """整个测试会话共享的GraphSetup实例，其余组件均为占位值"""
+    from tradingagents.default_config import DEFAULT_CONFIG
+    
+    return make_stub_setup(tuple(sorted(DEFAULT_CONFIG.items())))
+
+
+@pytest.fixture
+def graph_setup_with(graph_setup):
+    """返回工厂函数：在默认配置基础上覆盖指定配置项，相同配置复用同一实例"""
+    def _make(**overrides):
+        config = {**graph_setup.config, **overrides}
+        return make_stub_setup(tuple(sorted(config.items())))
+    return _make
@@ -217,6 +217,26 @@ class TestDecorators:
         except APIException as e:
             assert "Circuit breaker is OPEN" in str(e)
     
+    def test_circuit_breaker_expected_exception(self):
+        """测试断路器只统计expected_exception指定的异常"""
+        breaker = CircuitBreaker(
+            failure_threshold=2, timeout=0.1, expected_exception=(NetworkException,)
+        )
+        
+        def invalid_request():
+            raise ValueError("invalid request")
+        
+        # 非预期异常照常抛出，但不计入失败次数
+        for _ in range(3):
+            try:
+                breaker.call(invalid_request)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+        
+        assert breaker.state.value == "closed"
+        assert breaker.failure_count == 0
+    
     def test_validate_inputs_decorator(self):
         """测试输入验证装饰器"""
         
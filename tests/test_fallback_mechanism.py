@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试专用模型回退机制
+验证当专用模型调用失败时，是否正确回退到DEFAULT_MODEL
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+
+def test_default_model_config(monkeypatch):
+    """测试DEFAULT_MODEL配置"""
+    logger.info("🔧 测试DEFAULT_MODEL配置...")
+    
+    from tradingagents.default_config import build_default_config
+    
+    # 不受开发者本地导出的DEFAULT_MODEL影响，按未设置环境变量时构建配置
+    monkeypatch.delenv('DEFAULT_MODEL', raising=False)
+    default_model = build_default_config().get('default_model')
+    logger.debug("📊 默认配置中的default_model: %s", default_model)
+    
+    # 验证回退逻辑
+    expected_default = "deepseek-ai/DeepSeek-V3"
+    assert default_model == expected_default, \
+        f"DEFAULT_MODEL配置错误，期望: {expected_default}，实际: {default_model}"
+    logger.info("✅ DEFAULT_MODEL配置正确: %s", default_model)
+
+
+def test_fallback_llm_creation(graph_setup, monkeypatch):
+    """测试回退LLM创建功能"""
+    logger.info("🤖 测试回退LLM创建...")
+    
+    from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow
+    
+    # 使用会话共享的GraphSetup实例（其他组件为模拟值），创建实例不会访问网络
+    setup = graph_setup
+    monkeypatch.setenv('SILICONFLOW_API_KEY', 'sk-test')
+    
+    llm = setup._create_fallback_llm("deepseek-ai/DeepSeek-V3")
+    
+    assert isinstance(llm, ChatSiliconFlow)
+    assert llm.model_name == "deepseek-ai/DeepSeek-V3"
+    logger.info("  ✅ 回退LLM创建成功")
+
+
+def test_fallback_llm_without_api_key(graph_setup, monkeypatch):
+    """测试缺少API密钥时回退LLM最终使用快速思考模型"""
+    setup = graph_setup
+    quick_llm = object()
+    monkeypatch.setattr(setup, "quick_thinking_llm", quick_llm)
+    monkeypatch.delenv('SILICONFLOW_API_KEY', raising=False)
+    
+    assert setup._create_fallback_llm("deepseek-ai/DeepSeek-V3") is quick_llm
+    logger.info("  ✅ 缺少API密钥时回退到快速思考模型")
+
+
+def test_specialized_llm_fallback(graph_setup_with, monkeypatch):
+    """测试专用LLM的回退逻辑"""
+    logger.info("🔄 测试专用LLM回退逻辑...")
+    
+    # 模拟配置（故意不设置API密钥来触发回退）
+    setup = graph_setup_with(market_analyst_llm="meta-llama/Llama-3.1-70B-Instruct")
+    fallback_llm = object()
+    requested = []
+    monkeypatch.setattr(
+        setup, "_create_fallback_llm", lambda model_name: requested.append(model_name) or fallback_llm
+    )
+    
+    # 临时移除API密钥并设置DEFAULT_MODEL，测试结束后由monkeypatch自动恢复
+    monkeypatch.delenv('SILICONFLOW_API_KEY', raising=False)
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    
+    # 专用LLM创建应直接回退到DEFAULT_MODEL
+    assert setup._create_specialized_llm("market_analyst_llm") is fallback_llm
+    assert requested == ['deepseek-ai/DeepSeek-V3']
+    logger.info("  ✅ 缺少API密钥时专用LLM回退到DEFAULT_MODEL")
+
+
+def test_specialized_llm_wraps_default_fallback(graph_setup_with, monkeypatch):
+    """测试配置了API密钥时，专用LLM在永久错误时回退到DEFAULT_MODEL"""
+    from langchain_core.runnables import RunnableWithFallbacks
+    from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow, PERMANENT_ERRORS
+    
+    # 创建实例不会访问网络，测试用的密钥即可
+    monkeypatch.setenv('SILICONFLOW_API_KEY', 'sk-test')
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    setup = graph_setup_with(market_analyst_llm="meta-llama/Llama-3.1-70B-Instruct")
+    
+    llm = setup._create_specialized_llm("market_analyst_llm")
+    
+    assert isinstance(llm, RunnableWithFallbacks)
+    assert isinstance(llm.runnable, ChatSiliconFlow)
+    assert llm.runnable.model_name == "meta-llama/Llama-3.1-70B-Instruct"
+    assert len(llm.fallbacks) == 1
+    assert isinstance(llm.fallbacks[0], ChatSiliconFlow)
+    assert llm.fallbacks[0].model_name == "deepseek-ai/DeepSeek-V3"
+    assert tuple(llm.exceptions_to_handle) == PERMANENT_ERRORS
+    logger.info("  ✅ 专用LLM仅在永久错误时回退到DEFAULT_MODEL")
+
+
+def test_specialized_llm_same_as_default(graph_setup_with, monkeypatch):
+    """测试专用模型与DEFAULT_MODEL相同时不再包装回退"""
+    from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow
+    
+    monkeypatch.setenv('SILICONFLOW_API_KEY', 'sk-test')
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    setup = graph_setup_with(market_analyst_llm="deepseek-ai/DeepSeek-V3")
+    
+    llm = setup._create_specialized_llm("market_analyst_llm")
+    
+    assert isinstance(llm, ChatSiliconFlow)
+    assert llm.model_name == "deepseek-ai/DeepSeek-V3"
+
+
+def test_specialized_llm_without_fallback(graph_setup_with, monkeypatch):
+    """测试回退模型无法创建时直接返回专用LLM"""
+    from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow
+    
+    monkeypatch.setenv('SILICONFLOW_API_KEY', 'sk-test')
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    setup = graph_setup_with(market_analyst_llm="meta-llama/Llama-3.1-70B-Instruct")
+    monkeypatch.setattr(setup, "_create_fallback_llm", lambda model_name: None)
+    
+    llm = setup._create_specialized_llm("market_analyst_llm")
+    
+    assert isinstance(llm, ChatSiliconFlow)
+    assert llm.model_name == "meta-llama/Llama-3.1-70B-Instruct"
+
+
+def test_env_example_default_model(env_example_text, env_example_keys):
+    """测试.env.example是否包含DEFAULT_MODEL配置"""
+    logger.info("📄 测试.env.example DEFAULT_MODEL配置...")
+    
+    # 检查是否包含DEFAULT_MODEL配置
+    assert "DEFAULT_MODEL" in env_example_keys, ".env.example缺少DEFAULT_MODEL配置"
+    logger.info("  ✅ .env.example包含DEFAULT_MODEL配置")
+    
+    # 检查默认值
+    assert "DEFAULT_MODEL=deepseek-ai/DeepSeek-V3" in env_example_text, "DEFAULT_MODEL默认值不正确"
+    logger.info("  ✅ DEFAULT_MODEL默认值正确")
+
+
+def _failing_siliconflow(*args, **kwargs):
+    """模拟专用模型创建时出现异常"""
+    raise RuntimeError("模型创建失败")
+
+
+@pytest.mark.parametrize("overrides, api_key, break_creation", [
+    pytest.param({}, None, False, id="API密钥缺失"),
+    pytest.param({"market_analyst_llm": ""}, "sk-test", False, id="专用模型未配置"),
+    pytest.param({}, "sk-test", True, id="模型创建失败"),
+    pytest.param({"llm_provider": "openai"}, "sk-test", False, id="不支持的提供商"),
+])
+def test_fallback_scenarios(graph_setup_with, monkeypatch, overrides, api_key, break_creation):
+    """测试各种回退场景都回退到DEFAULT_MODEL"""
+    logger.info("🎯 测试回退场景...")
+    
+    setup = graph_setup_with(**{"market_analyst_llm": "meta-llama/Llama-3.1-70B-Instruct", **overrides})
+    fallback_llm = object()
+    requested = []
+    monkeypatch.setattr(
+        setup, "_create_fallback_llm", lambda model_name: requested.append(model_name) or fallback_llm
+    )
+    
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    if api_key:
+        monkeypatch.setenv('SILICONFLOW_API_KEY', api_key)
+    else:
+        monkeypatch.delenv('SILICONFLOW_API_KEY', raising=False)
+    if break_creation:
+        monkeypatch.setattr(
+            "tradingagents.llm_adapters.siliconflow_adapter.ChatSiliconFlow", _failing_siliconflow
+        )
+    
+    assert setup._create_specialized_llm("market_analyst_llm") is fallback_llm
+    assert requested == ['deepseek-ai/DeepSeek-V3']
+
+
+def test_default_model_priority(monkeypatch):
+    """测试DEFAULT_MODEL的优先级"""
+    logger.info("🏆 测试DEFAULT_MODEL优先级...")
+    
+    from tradingagents.default_config import build_default_config
+    
+    # 测试环境变量优先级：按当前环境重新构建配置，无需reload模块
+    monkeypatch.setenv('DEFAULT_MODEL', 'test-model-from-env')
+    default_model = build_default_config().get('default_model')
+    
+    assert default_model == 'test-model-from-env', \
+        f"环境变量优先级错误，期望: test-model-from-env，实际: {default_model}"
+    logger.info("  ✅ 环境变量DEFAULT_MODEL优先级正确")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "--log-cli-level=INFO", *sys.argv[1:]]))
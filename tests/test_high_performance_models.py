@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试高性能模型配置
+验证每个分析师是否使用了正确的专用高性能模型
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+# 视为高性能的模型
+HIGH_PERF_MODELS = frozenset({
+    "Qwen/Qwen2.5-72B-Instruct",
+    "meta-llama/Llama-3.1-70B-Instruct",
+    "deepseek-ai/DeepSeek-R1",
+    "Qwen/Qwen2.5-32B-Instruct"
+})
+
+# CLI中标识高性能模型选项的标记和模型名
+HIGH_PERF_INDICATORS = frozenset({
+    "🥇最高性能",
+    "🥈超强性能",
+    "🥉推理专用",
+    "Qwen/Qwen2.5-72B-Instruct",
+    "meta-llama/Llama-3.1-70B-Instruct"
+})
+
+
+def _strip_envsubst(value: str) -> str:
+    """去掉 ${VAR:-default} 形式的环境变量占位语法，只保留默认值"""
+    if value.startswith("${"):
+        return value.partition(":-")[2].rstrip("}")
+    return value
+
+
+def test_default_config(monkeypatch):
+    """测试默认配置是否使用高性能模型"""
+    logger.info("🔧 测试默认配置...")
+    
+    from tradingagents.default_config import build_default_config
+    
+    # 不受开发者本地导出的模型环境变量影响，检查代码中的默认值
+    for env_name in ("MARKET_ANALYST_LLM", "FUNDAMENTALS_ANALYST_LLM", "NEWS_ANALYST_LLM", "SOCIAL_ANALYST_LLM"):
+        monkeypatch.delenv(env_name, raising=False)
+    config = build_default_config()
+    
+    logger.debug("📊 默认配置检查:")
+    logger.debug("  LLM提供商: %s", config['llm_provider'])
+    logger.debug("  深度思考模型: %s", config['deep_think_llm'])
+    logger.debug("  快速思考模型: %s", config['quick_think_llm'])
+    logger.debug("  市场分析师模型: %s", config.get('market_analyst_llm', '未配置'))
+    logger.debug("  基本面分析师模型: %s", config.get('fundamentals_analyst_llm', '未配置'))
+    logger.debug("  新闻分析师模型: %s", config.get('news_analyst_llm', '未配置'))
+    logger.debug("  社交媒体分析师模型: %s", config.get('social_analyst_llm', '未配置'))
+    
+    # 验证是否使用高性能模型
+    checks = [
+        ("深度思考模型", config['deep_think_llm'] in HIGH_PERF_MODELS),
+        ("快速思考模型", config['quick_think_llm'] in HIGH_PERF_MODELS),
+        ("市场分析师模型", _strip_envsubst(config.get('market_analyst_llm', '')) in HIGH_PERF_MODELS),
+        ("基本面分析师模型", _strip_envsubst(config.get('fundamentals_analyst_llm', '')) in HIGH_PERF_MODELS),
+        ("新闻分析师模型", _strip_envsubst(config.get('news_analyst_llm', '')) in HIGH_PERF_MODELS),
+        ("社交媒体分析师模型", _strip_envsubst(config.get('social_analyst_llm', '')) in HIGH_PERF_MODELS),
+    ]
+    
+    failed = []
+    for check_name, passed in checks:
+        status = "✅" if passed else "❌"
+        logger.info("  %s %s", status, check_name)
+        if not passed:
+            failed.append(check_name)
+    
+    assert not failed, f"未使用高性能模型: {failed}"
+
+
+def test_env_example(env_example_text, env_example_keys):
+    """测试.env.example文件是否包含高性能模型配置"""
+    logger.info("📄 测试.env.example配置...")
+    
+    # 检查是否包含专用分析师模型配置
+    required_configs = {
+        "MARKET_ANALYST_LLM",
+        "FUNDAMENTALS_ANALYST_LLM",
+        "NEWS_ANALYST_LLM",
+        "SOCIAL_ANALYST_LLM",
+        "DEEP_THINK_LLM",
+        "QUICK_THINK_LLM",
+        "SILICONFLOW_API_KEY"
+    }
+    
+    logger.info("📋 .env.example检查:")
+    
+    missing = required_configs - env_example_keys
+    for config in sorted(required_configs & env_example_keys):
+        logger.info("  ✅ 包含配置: %s", config)
+    for config in sorted(missing):
+        logger.warning("  ❌ 缺少配置: %s", config)
+    
+    # 检查高性能模型
+    for model in sorted(HIGH_PERF_MODELS):
+        if model in env_example_text:
+            logger.info("  ✅ 包含高性能模型: %s", model)
+        else:
+            logger.warning("  ⚠️ 未找到模型: %s", model)
+    
+    assert not missing, f".env.example缺少配置: {sorted(missing)}"
+
+
+def test_specialized_llm_creation(graph_setup_with, monkeypatch):
+    """测试专用LLM创建功能"""
+    logger.info("🤖 测试专用LLM创建...")
+    
+    from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow
+    
+    # 模拟配置（基于会话共享的GraphSetup实例），创建实例不会访问网络
+    setup = graph_setup_with(
+        market_analyst_llm="meta-llama/Llama-3.1-70B-Instruct",
+        fundamentals_analyst_llm="Qwen/Qwen2.5-72B-Instruct"
+    )
+    monkeypatch.setenv('SILICONFLOW_API_KEY', 'sk-test')
+    monkeypatch.setenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+    
+    for config_key, model_name in [
+        ("market_analyst_llm", "meta-llama/Llama-3.1-70B-Instruct"),
+        ("fundamentals_analyst_llm", "Qwen/Qwen2.5-72B-Instruct"),
+    ]:
+        llm = setup._create_specialized_llm(config_key)
+        # 专用模型外层可能包装了回退，取主模型检查
+        primary = getattr(llm, "runnable", llm)
+        assert isinstance(primary, ChatSiliconFlow), f"{config_key}未使用硅基流动模型"
+        assert primary.model_name == model_name, f"{config_key}模型错误: {primary.model_name}"
+        logger.info("  ✅ %s使用专用模型: %s", config_key, model_name)
+
+
+def test_cli_options(cli_string_literals):
+    """测试CLI选项是否优先显示高性能模型"""
+    logger.info("💻 测试CLI选项...")
+    
+    from cli.utils import select_shallow_thinking_agent, select_deep_thinking_agent
+    
+    # 检查CLI选项是否存在
+    logger.info("📋 CLI选项检查:")
+    logger.info("  ✅ select_shallow_thinking_agent函数存在")
+    logger.info("  ✅ select_deep_thinking_agent函数存在")
+    
+    # 检查是否包含高性能模型选项
+    # 这里我们不能直接调用函数（因为它们需要用户交互），
+    # 但可以检查源代码的字符串字面量中是否包含高性能模型（选项标签中的标记允许是子串）
+    literal_text = "\n".join(cli_string_literals)
+    found_indicators = {indicator for indicator in HIGH_PERF_INDICATORS if indicator in literal_text}
+    
+    assert len(found_indicators) >= 3, \
+        f"CLI缺少高性能模型指示器: {sorted(HIGH_PERF_INDICATORS - found_indicators)}"
+    logger.info("  ✅ CLI包含高性能模型指示器: %s/%s", len(found_indicators), len(HIGH_PERF_INDICATORS))
+
+
+def test_model_performance_ranking():
+    """测试模型性能排序"""
+    logger.info("🏆 测试模型性能排序...")
+    
+    # 定义性能排序（从高到低）
+    performance_ranking = [
+        "Qwen/Qwen2.5-72B-Instruct",      # 🥇 72B参数，最高性能
+        "meta-llama/Llama-3.1-70B-Instruct", # 🥈 70B参数，长上下文
+        "deepseek-ai/DeepSeek-R1",         # 🥉 推理专用
+        "deepseek-ai/DeepSeek-V3",         # 🏅 最新版本
+        "Qwen/Qwen2.5-32B-Instruct",      # 🎯 中文优化
+        "Qwen/Qwen2.5-14B-Instruct",      # ⚡ 轻量级
+    ]
+    
+    # 定义分析师专业化分配
+    analyst_assignments = {
+        "基本面分析师": "Qwen/Qwen2.5-72B-Instruct",      # 需要最强计算能力
+        "市场分析师": "meta-llama/Llama-3.1-70B-Instruct",   # 需要长上下文处理
+        "新闻分析师": "deepseek-ai/DeepSeek-R1",            # 需要强推理能力
+        "社交媒体分析师": "Qwen/Qwen2.5-32B-Instruct",      # 需要中文优化
+    }
+    
+    logger.debug("📊 模型性能排序（从高到低）:")
+    for i, model in enumerate(performance_ranking, 1):
+        logger.debug("  %s. %s", i, model)
+    
+    logger.debug("🎯 分析师专业化分配:")
+    for analyst, model in analyst_assignments.items():
+        rank = performance_ranking.index(model) + 1
+        logger.debug("  %s: %s (性能排名: #%s)", analyst, model, rank)
+    
+    # 验证分配是否合理（基本面分析师应该使用最高性能模型）
+    fundamentals_model = analyst_assignments["基本面分析师"]
+    assert fundamentals_model == performance_ranking[0], "基本面分析师未使用最高性能模型"
+    logger.info("  ✅ 基本面分析师使用最高性能模型")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "--log-cli-level=INFO", *sys.argv[1:]]))
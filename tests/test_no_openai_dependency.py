@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试移除OpenAI依赖后的完整功能
+验证所有新闻和情绪分析功能都有可用的替代方案
+"""
+
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+# 行首（允许缩进）的import语句才算活跃导入，注释和字符串中的文本不计
+_ACTIVE_OPENAI_IMPORT_RE = re.compile(rb'(?m)^[ \t]*(?:from openai import|import openai\b)')
+# 扫描时跳过的目录：缓存、虚拟环境及第三方依赖
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "env", "node_modules"})
+# 允许导入openai SDK的文件（相对项目根目录）：
+# 硅基流动适配器继承ChatOpenAI走OpenAI兼容协议，本身就依赖openai SDK，
+# 这里只引用SDK的异常类型区分瞬时/永久错误，并不调用OpenAI服务
+_ALLOWED_OPENAI_IMPORTS = frozenset({
+    Path("tradingagents", "llm_adapters", "siliconflow_adapter.py"),
+})
+
+
+def _iter_py_files(root: Path):
+    """遍历项目中的.py文件，在os.walk中就地剪掉无需扫描的目录"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath) / filename
+
+
+def test_news_tools(mock_news_apis):
+    """测试新闻工具（数据接口已模拟，不访问外部网络）"""
+    logger.info("📰 测试新闻工具...")
+    
+    from tradingagents.agents.utils.agent_utils import Toolkit
+    
+    # 测试Google新闻
+    logger.info("  🔍 测试Google新闻...")
+    google_result = Toolkit.get_google_news.invoke({"query": "AAPL stock", "curr_date": "2024-12-20"})
+    assert google_result, "Google新闻结果为空"
+    mock_news_apis["get_google_news"].assert_called_once_with("AAPL stock", "2024-12-20", 7)
+    logger.info("  ✅ Google新闻: %s 字符", len(google_result))
+    
+    # 测试FinnHub新闻
+    logger.info("  📊 测试FinnHub新闻...")
+    finnhub_result = Toolkit.get_finnhub_news.invoke(
+        {"ticker": "AAPL", "start_date": "2024-12-13", "end_date": "2024-12-20"}
+    )
+    assert finnhub_result, "FinnHub新闻结果为空"
+    mock_news_apis["get_finnhub_news"].assert_called_once_with("AAPL", "2024-12-20", 7)
+    logger.info("  ✅ FinnHub新闻: %s 字符", len(finnhub_result))
+    
+    # 测试实时新闻
+    logger.info("  ⚡ 测试实时新闻...")
+    realtime_result = Toolkit.get_realtime_stock_news.invoke({"ticker": "AAPL", "curr_date": "2024-12-20"})
+    assert realtime_result, "实时新闻结果为空"
+    mock_news_apis["get_realtime_stock_news"].assert_called_once_with("AAPL", "2024-12-20", hours_back=6)
+    logger.info("  ✅ 实时新闻: %s 字符", len(realtime_result))
+
+
+def test_social_sentiment_tools(mock_news_apis):
+    """测试社交情绪工具（数据接口已模拟，不访问外部网络）"""
+    logger.info("😊 测试社交情绪工具...")
+    
+    from tradingagents.agents.utils.agent_utils import Toolkit
+    
+    # 测试中国社交媒体情绪（A股代码走增强版中国股票新闻）
+    logger.info("  🇨🇳 测试中国社交媒体情绪...")
+    chinese_result = Toolkit.get_chinese_social_sentiment.invoke({"ticker": "000001", "curr_date": "2024-12-20"})
+    assert chinese_result, "中国社交媒体结果为空"
+    mock_news_apis["get_china_stock_news_enhanced"].assert_called_once_with("000001", "2024-12-20")
+    logger.info("  ✅ 中国社交媒体: %s 字符", len(chinese_result))
+    
+    # 测试Reddit情绪
+    logger.info("  🌍 测试Reddit情绪...")
+    reddit_result = Toolkit.get_reddit_stock_info.invoke({"ticker": "AAPL", "curr_date": "2024-12-20"})
+    assert reddit_result, "Reddit情绪结果为空"
+    mock_news_apis["get_reddit_company_news"].assert_called_once_with("AAPL", "2024-12-20", 7, 5)
+    logger.info("  ✅ Reddit情绪: %s 字符", len(reddit_result))
+
+
+def test_analyst_initialization():
+    """测试分析师初始化"""
+    logger.info("🤖 测试分析师初始化...")
+    
+    from tradingagents.agents.analysts.social_media_analyst import SocialMediaAnalyst
+    from tradingagents.agents.analysts.news_analyst import NewsAnalyst
+    from tradingagents.agents.utils.agent_utils import AgentUtils
+    from tradingagents.default_config import DEFAULT_CONFIG
+    
+    # 创建工具包
+    toolkit = AgentUtils(config=DEFAULT_CONFIG)
+    
+    # 测试社交媒体分析师
+    logger.info("  📱 测试社交媒体分析师...")
+    SocialMediaAnalyst(toolkit)
+    logger.info("  ✅ 社交媒体分析师初始化成功")
+    
+    # 测试新闻分析师
+    logger.info("  📰 测试新闻分析师...")
+    NewsAnalyst(toolkit)
+    logger.info("  ✅ 新闻分析师初始化成功")
+
+
+def test_trading_graph_tools():
+    """测试交易图工具节点"""
+    logger.info("📊 测试交易图工具节点...")
+    
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+    from tradingagents.default_config import DEFAULT_CONFIG
+    
+    # 创建配置（使用硅基流动）
+    config = DEFAULT_CONFIG.copy()
+    config["llm_provider"] = "siliconflow"
+    config["deep_think_llm"] = "deepseek-ai/DeepSeek-V3"
+    config["quick_think_llm"] = "deepseek-ai/DeepSeek-V3"
+    
+    # 测试初始化（会因为API密钥验证失败，但这是预期的）
+    try:
+        ta = TradingAgentsGraph(config=config, debug=True)
+    except ValueError as e:
+        assert "SILICONFLOW_API_KEY" in str(e), f"意外的错误: {e}"
+        logger.info("  ✅ 交易图正确验证API密钥（预期行为）")
+        return
+    
+    logger.info("  ✅ 交易图初始化成功")
+    
+    # 检查工具节点
+    if hasattr(ta, 'tools'):
+        social_tools = ta.tools.get('social', None)
+        news_tools = ta.tools.get('news', None)
+        
+        if social_tools:
+            logger.info("  ✅ 社交媒体工具节点配置正确")
+        if news_tools:
+            logger.info("  ✅ 新闻工具节点配置正确")
+
+
+def test_openai_imports():
+    """检查是否还有OpenAI导入"""
+    logger.info("🔍 检查OpenAI导入...")
+    
+    # 检查interface.py
+    interface_file = project_root / "tradingagents" / "dataflows" / "interface.py"
+    if interface_file.exists():
+        content = interface_file.read_bytes()
+        assert not _ACTIVE_OPENAI_IMPORT_RE.search(content), "interface.py 仍有活跃的OpenAI导入"
+        logger.info("  ✅ interface.py OpenAI导入已移除或注释")
+    
+    # 检查是否有其他文件导入OpenAI
+    openai_files = []
+    for py_file in _iter_py_files(project_root):
+        try:
+            content = py_file.read_bytes()
+        except OSError:
+            continue
+        # 先做廉价的子串预筛，绝大多数文件无需正则扫描
+        if b"openai" in content and _ACTIVE_OPENAI_IMPORT_RE.search(content):
+            if py_file.relative_to(project_root) not in _ALLOWED_OPENAI_IMPORTS:
+                openai_files.append(py_file)
+    
+    if openai_files:
+        logger.warning("  ⚠️ 发现 %s 个文件仍有OpenAI导入:", len(openai_files))
+        for file in openai_files[:5]:  # 只显示前5个
+            logger.warning("    - %s", file.relative_to(project_root))
+    else:
+        logger.info("  ✅ 未发现活跃的OpenAI导入")
+    
+    assert not openai_files, f"发现 {len(openai_files)} 个文件仍有OpenAI导入"
+
+
+def test_deprecated_functions(mock_news_apis):
+    """测试已弃用的函数是否正确回退（只验证回退分支，不获取真实数据）"""
+    logger.info("🔄 测试已弃用函数的回退机制...")
+    
+    from tradingagents.dataflows import interface
+    
+    # 测试get_stock_news_openai回退
+    logger.info("  📰 测试get_stock_news_openai回退...")
+    result1 = interface.get_stock_news_openai("AAPL", "2024-12-20")
+    assert result1, "get_stock_news_openai 回退结果为空"
+    mock_news_apis["get_google_news"].assert_called_with("AAPL stock news", "2024-12-20", 7)
+    logger.info("  ✅ get_stock_news_openai 成功回退到Google新闻")
+    
+    # 测试get_global_news_openai回退
+    logger.info("  🌍 测试get_global_news_openai回退...")
+    result2 = interface.get_global_news_openai("2024-12-20")
+    assert result2, "get_global_news_openai 回退结果为空"
+    mock_news_apis["get_google_news"].assert_called_with("global economy news", "2024-12-20", 7)
+    logger.info("  ✅ get_global_news_openai 成功回退到Google新闻")
+    
+    # 测试get_fundamentals_openai回退
+    logger.info("  📊 测试get_fundamentals_openai回退...")
+    result3 = interface.get_fundamentals_openai("AAPL", "2024-12-20")
+    assert result3, "get_fundamentals_openai 回退结果为空"
+    mock_news_apis["get_fundamentals_finnhub"].assert_called_once_with("AAPL", "2024-12-20")
+    logger.info("  ✅ get_fundamentals_openai 成功回退到FinnHub")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v", "--log-cli-level=INFO", *sys.argv[1:]]))
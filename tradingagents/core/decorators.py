@@ -9,7 +9,8 @@ import time
 import random
 import functools
 import logging
-from typing import Callable, Any, Optional, Type, Union
+import threading
+from typing import Callable, Any, Optional, Tuple, Type, Union
 from enum import Enum
 
 from .exceptions import (
@@ -53,7 +54,7 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         timeout: float = 60.0,
-        expected_exception: Type[Exception] = Exception
+        expected_exception: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception
     ):
         self.failure_threshold = failure_threshold
         self.timeout = timeout
@@ -62,19 +63,22 @@ class CircuitBreaker:
         self.last_failure_time = None
         self.state = CircuitState.CLOSED
         self.success_count = 0  # 半开状态下的成功计数
+        # 同一断路器可能被多个线程共享，状态读写需加锁（被保护的调用本身不持锁）
+        self._lock = threading.Lock()
     
     def call(self, func: Callable, *args, **kwargs):
         """通过断路器调用函数"""
-        if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.timeout:
-                self.state = CircuitState.HALF_OPEN
-                self.success_count = 0
-                logging.info(f"Circuit breaker for {func.__name__} switched to HALF_OPEN")
-            else:
-                raise APIException(
-                    f"Circuit breaker is OPEN for {func.__name__}",
-                    error_code="CIRCUIT_BREAKER_OPEN"
-                )
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if time.time() - self.last_failure_time > self.timeout:
+                    self.state = CircuitState.HALF_OPEN
+                    self.success_count = 0
+                    logging.info(f"Circuit breaker for {func.__name__} switched to HALF_OPEN")
+                else:
+                    raise APIException(
+                        f"Circuit breaker is OPEN for {func.__name__}",
+                        error_code="CIRCUIT_BREAKER_OPEN"
+                    )
         
         try:
             result = func(*args, **kwargs)
@@ -86,34 +90,38 @@ class CircuitBreaker:
     
     def _on_success(self):
         """成功回调"""
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            if self.success_count >= 3:  # 连续3次成功后关闭断路器
-                self.state = CircuitState.CLOSED
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                self.success_count += 1
+                if self.success_count >= 3:  # 连续3次成功后关闭断路器
+                    self.state = CircuitState.CLOSED
+                    self.failure_count = 0
+                    logging.info("Circuit breaker switched to CLOSED")
+            else:
                 self.failure_count = 0
-                logging.info("Circuit breaker switched to CLOSED")
-        else:
-            self.failure_count = 0
     
     def _on_failure(self):
         """失败回调"""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-            logging.warning(f"Circuit breaker switched to OPEN after {self.failure_count} failures")
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+            
+            if self.failure_count >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                logging.warning(f"Circuit breaker switched to OPEN after {self.failure_count} failures")
 
 
 # 全局断路器实例
 _circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
 
 
 def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
     """获取或创建断路器实例"""
-    if name not in _circuit_breakers:
-        _circuit_breakers[name] = CircuitBreaker(**kwargs)
-    return _circuit_breakers[name]
+    with _circuit_breakers_lock:
+        if name not in _circuit_breakers:
+            _circuit_breakers[name] = CircuitBreaker(**kwargs)
+        return _circuit_breakers[name]
 
 
 def handle_exceptions(
@@ -59,7 +59,7 @@ class GraphSetup:
 
         if "siliconflow" in llm_provider or "硅基流动" in self.config.get("llm_provider", ""):
             # 创建硅基流动专用LLM
-            from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow
+            from tradingagents.llm_adapters.siliconflow_adapter import ChatSiliconFlow, PERMANENT_ERRORS
 
             siliconflow_api_key = os.getenv('SILICONFLOW_API_KEY')
             if not siliconflow_api_key:
@@ -75,12 +75,23 @@ class GraphSetup:
                     max_tokens=2000
                 )
                 print(f"✅ {config_key}成功创建专用模型: {model_name}")
-                return specialized_llm
             except Exception as e:
                 default_model = os.getenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
                 print(f"❌ {config_key}专用模型创建失败: {e}")
                 print(f"🔄 回退到默认模型: {default_model}")
                 return self._create_fallback_llm(default_model)
+
+            # 模型名称错误、密钥无效等问题要到实际调用时才暴露（401/403/404），
+            # 这类错误重试无意义，调用时直接切换到DEFAULT_MODEL；瞬时错误仍由客户端自行重试
+            default_model = os.getenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
+            if default_model == model_name:
+                return specialized_llm
+            fallback_llm = self._create_fallback_llm(default_model)
+            if fallback_llm is None:
+                return specialized_llm
+            return specialized_llm.with_fallbacks(
+                [fallback_llm], exceptions_to_handle=PERMANENT_ERRORS
+            )
         else:
             # 其他提供商暂时回退到默认模型
             default_model = os.getenv('DEFAULT_MODEL', 'deepseek-ai/DeepSeek-V3')
@@ -131,12 +131,22 @@ class TradingAgentsGraph:
             if not siliconflow_api_key:
                 raise ValueError("使用硅基流动需要设置SILICONFLOW_API_KEY环境变量")
 
+            # 可选：深度思考模型逐token输出到终端，缩短首字节等待时间
+            deep_stream_kwargs = {}
+            if self.config.get("stream_deep_think", False):
+                from langchain_core.callbacks import StreamingStdOutCallbackHandler
+                deep_stream_kwargs = {
+                    "streaming": True,
+                    "callbacks": [StreamingStdOutCallbackHandler()],
+                }
+
             print("🔧 使用硅基流动 API (支持多种模型)")
             self.deep_thinking_llm = ChatSiliconFlow(
                 model=self.config["deep_think_llm"],
                 api_key=siliconflow_api_key,
                 temperature=0.1,
-                max_tokens=2000
+                max_tokens=2000,
+                **deep_stream_kwargs
             )
             self.quick_thinking_llm = ChatSiliconFlow(
                 model=self.config["quick_think_llm"],
@@ -7,6 +7,7 @@
 
 import os
 from typing import Optional, Dict, Any, List
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
 from langchain_core.outputs import ChatResult, ChatGeneration
@@ -14,6 +15,24 @@ from langchain_core.outputs import ChatResult, ChatGeneration
 # 避免循环导入，直接继承ChatOpenAI
 from langchain_openai import ChatOpenAI
 
+from tradingagents.core.decorators import CircuitBreaker, get_circuit_breaker
+
+
+# 瞬时错误：限流、连接/超时、服务端5xx，可退避重试
+TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # 包含 APITimeoutError
+    openai.InternalServerError,
+)
+
+# 永久错误：认证失败(401)、无权限(403)、模型不存在(404)，重试无意义，应立即回退
+# 不包含ValueError等通用异常，以免提示词或格式化错误被静默切换到DEFAULT_MODEL
+PERMANENT_ERRORS = (
+    openai.AuthenticationError,
+    openai.PermissionDeniedError,
+    openai.NotFoundError,
+)
+
 
 class ChatSiliconFlow(ChatOpenAI):
     """硅基流动 OpenAI 兼容适配器"""
@@ -149,6 +168,18 @@ def get_available_siliconflow_models() -> Dict[str, Dict[str, Any]]:
     return SILICONFLOW_MODELS
 
 
+def get_siliconflow_breaker() -> CircuitBreaker:
+    """
+    获取进程内共享的硅基流动断路器
+    
+    连续3次瞬时错误后断开30秒，期间调用立即失败，避免服务不可用时逐个等待超时；
+    401/403/404等永久错误只与具体请求有关，不计入失败次数
+    """
+    return get_circuit_breaker(
+        "siliconflow", failure_threshold=3, timeout=30.0, expected_exception=TRANSIENT_ERRORS
+    )
+
+
 def create_siliconflow_llm(
     model: str = "deepseek-ai/DeepSeek-V3",
     api_key: Optional[str] = None,
@@ -210,7 +241,9 @@ def test_siliconflow_connection(api_key: Optional[str] = None) -> bool:
         )
         
         # 发送测试消息
-        response = llm.invoke([HumanMessage(content="你好，请回复'连接成功'")])
+        response = get_siliconflow_breaker().call(
+            llm.invoke, [HumanMessage(content="你好，请回复'连接成功'")]
+        )
         
         if response and response.content:
             print("✅ 硅基流动连接测试成功")